@@ -1231,11 +1231,7 @@ class RobotSimulationGUI:
             self.ax.clear()
             
             link_positions = self.visualizer.compute_link_positions(dh_params, joint_angles)
-            
-            link_positions_m = []
-            for pos in link_positions:
-                pos_m = [pos[0] * self.CM_TO_M, pos[1] * self.CM_TO_M, pos[2] * self.CM_TO_M]
-                link_positions_m.append(pos_m)
+            link_positions_m = link_positions * self.CM_TO_M
             
             self.visualizer.draw_robot_links(self.ax, link_positions_m)
             self.visualizer.draw_joints(self.ax, link_positions_m)
@@ -1498,14 +1494,15 @@ class RobotSimulationGUI:
                 
                 try:
                     link_positions = self.visualizer.compute_link_positions(dh_params, joint_angles)
-                    for pos in link_positions:
-                        z_pos_m = pos[2] * self.CM_TO_M
-                        if z_pos_m < -0.02:
-                            return {
-                                'valid': False,
-                                'reason': f"스텝 {i+1}에서 바닥과 충돌 (Z={z_pos_m:.3f}m)",
-                                'warnings': warnings
-                            }
+                    z_positions_m = link_positions[:, 2] * self.CM_TO_M
+                    below_floor = np.flatnonzero(z_positions_m < -0.02)
+                    if below_floor.size:
+                        z_pos_m = z_positions_m[below_floor[0]]
+                        return {
+                            'valid': False,
+                            'reason': f"스텝 {i+1}에서 바닥과 충돌 (Z={z_pos_m:.3f}m)",
+                            'warnings': warnings
+                        }
                 except:
                     pass
                 
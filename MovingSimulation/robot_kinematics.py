@@ -14,8 +14,16 @@ from scipy.optimize import fsolve, minimize, least_squares
 import warnings
 
 class RobotKinematics:
-    def __init__(self):
-        """로봇 운동학 클래스 초기화"""
+    def __init__(self, dtype=np.float64):
+        """로봇 운동학 클래스 초기화
+        
+        Args:
+            dtype: FK/자코비언/작업공간 계산에 사용할 부동소수점 타입.
+                대량 샘플 계산에는 np.float32 를 지정하면 메모리 대역폭이 절반으로 줄어든다.
+                수치 역기구학, 해석적 역기구학, 특이점 검사는 정밀도를 위해 항상 float64 로 계산한다.
+        """
+        self.dtype = np.dtype(dtype)
+        
         # 관절 제한값 설정 (도 단위)
         self.joint_limits = {
             0: (-180, 180),
@@ -26,11 +34,29 @@ class RobotKinematics:
             5: (-180, 180),
         }
         
+        # 벡터화된 제한 검사를 위한 관절 제한값 배열 (라디안)
+        self._limits_lo_rad = np.deg2rad([self.joint_limits[i][0] for i in range(len(self.joint_limits))])
+        self._limits_hi_rad = np.deg2rad([self.joint_limits[i][1] for i in range(len(self.joint_limits))])
+        
         # 특이점 임계값
         self.singularity_threshold = 1e-6
         self.condition_number_threshold = 100
         
-    def dh_transform_matrix(self, a, alpha, d, theta):
+        # 2DOF 평면 IK용 링크 상수 캐시 {(a1_cm, a2_cm): (l1, l2, l1², l2², 2·l1·l2, (l1+l2)², (l1-l2)²)}
+        self._dh_cache_planar = {}
+        
+        # 수치 역기구학 설정 (least_squares 종료 조건, SciPy 기본값 1e-8/무제한보다 느슨하게)
+        self.ik_ftol = 1e-6
+        self.ik_xtol = 1e-6
+        self.ik_max_nfev = 200
+        
+        # 마지막 역기구학 해 (ik_warm_start=True일 때만 초기 추정값으로 재사용)
+        # 해를 구한 DH 테이블을 함께 기록하여 DH 파라미터나 DOF가 바뀌면 재사용하지 않음
+        self.ik_warm_start = False
+        self._last_q = None
+        self._last_q_dh = None
+        
+    def dh_transform_matrix(self, a, alpha, d, theta, dtype=None):
         """DH 파라미터로부터 동차 변환 행렬 계산
         
         Args:
@@ -38,6 +64,7 @@ class RobotKinematics:
             alpha (float): 링크 트위스트 (라디안)
             d (float): 링크 오프셋 (cm)  
             theta (float): 관절 각도 (라디안)
+            dtype: 결과 행렬의 타입 (None이면 self.dtype)
         """
         # cm를 m로 변환
         a_m = a / 100.0
@@ -55,42 +82,120 @@ class RobotKinematics:
             [sin_theta,  cos_theta * cos_alpha, -cos_theta * sin_alpha, a_m * sin_theta],
             [0,          sin_alpha,              cos_alpha,             d_m],
             [0,          0,                      0,                     1]
-        ])
+        ], dtype=self.dtype if dtype is None else dtype)
         
         return T
     
-    def forward_kinematics(self, dh_params, joint_angles):
+    def forward_kinematics(self, dh_params, joint_angles, dtype=None):
         """정기구학 계산 - 관절 각도로부터 end-effector 위치 계산
         
         Args:
             dh_params (list): DH 파라미터 리스트 [[a, alpha, d, theta], ...]
             joint_angles (list): 관절 각도 리스트 (라디안)
+            dtype: 계산 타입 (None이면 self.dtype)
             
         Returns:
             numpy.ndarray: End-effector의 4x4 동차 변환 행렬
         """
-        # 단위 행렬로 시작
-        T_total = np.eye(4)
+        if dtype is None:
+            dtype = self.dtype
         
-        # 각 링크에 대해 변환 행렬 계산 및 곱셈
-        for i, (dh_param, joint_angle) in enumerate(zip(dh_params, joint_angles)):
-            a, alpha_deg, d, theta_offset_deg = dh_param
-            
-            # 각도를 라디안으로 변환
-            alpha = np.radians(alpha_deg)
-            theta_offset = np.radians(theta_offset_deg)
+        # 누적 변환 행렬 스택의 마지막 원소가 End-effector 변환
+        return self._cumulative_transforms(dh_params, joint_angles, dtype)[-1]
+    
+    def _dh_transform_batch(self, a, alpha, d, theta, dtype):
+        """DH 동차 변환 행렬을 여러 관절 각도에 대해 한 번에 계산
+        
+        a, alpha, d는 스칼라이거나 theta와 같은 모양의 배열일 수 있다.
+        
+        Args:
+            a (float or numpy.ndarray): 링크 길이 (cm)
+            alpha (float or numpy.ndarray): 링크 트위스트 (라디안)
+            d (float or numpy.ndarray): 링크 오프셋 (cm)
+            theta (numpy.ndarray): (M,) 관절 각도 (라디안)
+            dtype: 결과 행렬의 타입
             
-            # 실제 관절 각도 = 오프셋 + 관절 변수
-            theta = joint_angle + theta_offset
+        Returns:
+            numpy.ndarray: (M, 4, 4) 동차 변환 행렬
+        """
+        cos_theta = np.cos(theta)
+        sin_theta = np.sin(theta)
+        cos_alpha = np.cos(alpha)
+        sin_alpha = np.sin(alpha)
+        
+        T = np.zeros(theta.shape + (4, 4), dtype=dtype)
+        T[..., 0, 0] = cos_theta
+        T[..., 0, 1] = -sin_theta * cos_alpha
+        T[..., 0, 2] = sin_theta * sin_alpha
+        T[..., 0, 3] = a / 100.0 * cos_theta
+        T[..., 1, 0] = sin_theta
+        T[..., 1, 1] = cos_theta * cos_alpha
+        T[..., 1, 2] = -cos_theta * sin_alpha
+        T[..., 1, 3] = a / 100.0 * sin_theta
+        T[..., 2, 1] = sin_alpha
+        T[..., 2, 2] = cos_alpha
+        T[..., 2, 3] = d / 100.0
+        T[..., 3, 3] = 1.0
+        
+        return T
+    
+    def forward_kinematics_batch(self, dh_params, joint_angles_batch, dtype=None):
+        """여러 관절 각도 샘플에 대한 정기구학 일괄 계산
+        
+        Args:
+            dh_params (list): DH 파라미터 리스트 [[a, alpha, d, theta], ...]
+            joint_angles_batch (array-like): (M, N) 관절 각도 배열 (라디안)
+            dtype: 계산 타입 (None이면 self.dtype)
             
-            # DH 변환 행렬 계산 (모든 각도를 라디안으로 전달)
-            T_i = self.dh_transform_matrix(a, alpha, d, theta)
+        Returns:
+            numpy.ndarray: (M, 4, 4) End-effector 동차 변환 행렬
+        """
+        if dtype is None:
+            dtype = self.dtype
+        
+        joint_angles_batch = np.asarray(joint_angles_batch, dtype=dtype)
+        n_samples = joint_angles_batch.shape[0]
+        
+        T_total = np.tile(np.eye(4, dtype=dtype), (n_samples, 1, 1))
+        
+        for i, dh_param in enumerate(dh_params[:joint_angles_batch.shape[1]]):
+            a, alpha_deg, d, theta_offset_deg = dh_param
+            theta = joint_angles_batch[:, i] + np.radians(theta_offset_deg)
             
-            # 누적 변환
-            T_total = np.dot(T_total, T_i)
+            T_i = self._dh_transform_batch(a, np.radians(alpha_deg), d, theta, dtype)
+            T_total = np.matmul(T_total, T_i)
         
         return T_total
     
+    def _link_transforms(self, dh_params, joint_angles, dtype):
+        """각 링크의 DH 변환 행렬을 (N, 4, 4) 스택으로 한 번에 계산"""
+        n_joints = min(len(dh_params), len(joint_angles))
+        dh = np.asarray(dh_params[:n_joints], dtype=np.float64).reshape(n_joints, 4)
+        
+        # 실제 관절 각도 = 오프셋 + 관절 변수
+        theta = np.asarray(joint_angles[:n_joints], dtype=np.float64) + np.radians(dh[:, 3])
+        
+        return self._dh_transform_batch(dh[:, 0], np.radians(dh[:, 1]), dh[:, 2], theta, dtype)
+    
+    def _cumulative_transforms(self, dh_params, joint_angles, dtype=None):
+        """베이스부터 각 링크까지의 누적 변환 행렬 스택 계산
+        
+        Returns:
+            numpy.ndarray: (N+1, 4, 4) 누적 변환 행렬 (0번은 베이스의 단위 행렬,
+                마지막은 End-effector)
+        """
+        if dtype is None:
+            dtype = self.dtype
+        
+        T_links = self._link_transforms(dh_params, joint_angles, dtype)
+        
+        T_cumulative = np.empty((len(T_links) + 1, 4, 4), dtype=dtype)
+        T_cumulative[0] = np.eye(4, dtype=dtype)
+        for i in range(len(T_links)):
+            np.matmul(T_cumulative[i], T_links[i], out=T_cumulative[i + 1])
+        
+        return T_cumulative
+    
     def compute_jacobian(self, dh_params, joint_angles):
         """자코비언 행렬 계산
         
@@ -102,51 +207,36 @@ class RobotKinematics:
             numpy.ndarray: 6xN 자코비언 행렬 (N은 DOF)
         """
         n_joints = len(joint_angles)
-        jacobian = np.zeros((6, n_joints))
+        jacobian = np.zeros((6, n_joints), dtype=self.dtype)
         
-        # 각 관절의 원점과 z축 방향 벡터 계산
-        origins = [np.array([0, 0, 0])]
-        z_axes = [np.array([0, 0, 1])]
+        # 각 관절의 원점과 z축 방향 벡터 (누적 변환 행렬 스택에서 추출)
+        T_cumulative = self._cumulative_transforms(dh_params, joint_angles)
+        origins = T_cumulative[:, :3, 3]
+        z_axes = T_cumulative[:, :3, 2]
         
-        T_cumulative = np.eye(4)
+        # 병진 속도 부분: z_i × (p_e - p_i) = [z_i]× (p_e - p_i)
+        z_joint = z_axes[:n_joints]
+        p_diff = origins[-1] - origins[:n_joints]
         
-        # 각 관절까지의 변환 행렬 계산
-        for i in range(n_joints):
-            a, alpha_deg, d, theta_offset_deg = dh_params[i]
-            alpha = np.radians(alpha_deg)
-            theta_offset = np.radians(theta_offset_deg)
-            theta = joint_angles[i] + theta_offset
-            
-            T_i = self.dh_transform_matrix(a, alpha, d, theta)
-            T_cumulative = np.dot(T_cumulative, T_i)
-            
-            # 관절 i의 원점과 z축
-            origin_i = T_cumulative[:3, 3]
-            z_axis_i = T_cumulative[:3, 2]
-            
-            origins.append(origin_i)
-            z_axes.append(z_axis_i)
-        
-        # End-effector 위치
-        end_effector_pos = origins[-1]
+        skew_z = np.zeros((n_joints, 3, 3), dtype=self.dtype)
+        skew_z[:, 0, 1] = -z_joint[:, 2]
+        skew_z[:, 0, 2] = z_joint[:, 1]
+        skew_z[:, 1, 0] = z_joint[:, 2]
+        skew_z[:, 1, 2] = -z_joint[:, 0]
+        skew_z[:, 2, 0] = -z_joint[:, 1]
+        skew_z[:, 2, 1] = z_joint[:, 0]
         
-        # 각 관절에 대한 자코비언 열 계산
-        for i in range(n_joints):
-            # 병진 속도 부분: z_i × (p_e - p_i)
-            p_diff = end_effector_pos - origins[i]
-            v_linear = np.cross(z_axes[i], p_diff)
-            
-            # 각속도 부분: z_i
-            v_angular = z_axes[i]
-            
-            # 자코비언 열 구성
-            jacobian[:3, i] = v_linear
-            jacobian[3:, i] = v_angular
+        # 자코비언 열 구성 (각속도 부분: z_i)
+        jacobian[:3, :] = np.einsum('nij,nj->in', skew_z, p_diff)
+        jacobian[3:, :] = z_joint.T
         
         return jacobian
     
     def check_singularity(self, jacobian):
         """특이점 검사"""
+        # 행렬식/조건수는 정밀도가 중요하므로 float64 로 계산
+        jacobian = np.asarray(jacobian, dtype=np.float64)
+        
         # 자코비언이 정사각행렬이 아닌 경우 처리
         if jacobian.shape[0] != jacobian.shape[1]:
             jacobian_square = np.dot(jacobian.T, jacobian)
@@ -156,13 +246,13 @@ class RobotKinematics:
         # 행렬식 계산
         try:
             det = np.linalg.det(jacobian_square)
-        except:
+        except np.linalg.LinAlgError:
             det = 0.0
         
         # 조건수 계산
         try:
             cond_num = np.linalg.cond(jacobian_square)
-        except:
+        except np.linalg.LinAlgError:
             cond_num = float('inf')
         
         # 계수 계산
@@ -189,7 +279,7 @@ class RobotKinematics:
         try:
             JTJ_damped = np.dot(jacobian.T, jacobian) + damping_matrix
             J_pinv = np.dot(np.linalg.inv(JTJ_damped), jacobian.T)
-        except:
+        except np.linalg.LinAlgError:
             J_pinv = np.linalg.pinv(jacobian)
         
         return J_pinv
@@ -199,43 +289,74 @@ class RobotKinematics:
         """역기구학 계산"""
         n_joints = len(dh_params)
         
-        # 초기 추정값 설정
+        # 초기 추정값 설정 (warm-start가 켜져 있고 같은 DH 테이블의 직전 해가 있으면 재사용)
+        dh_key = None
+        if self.ik_warm_start:
+            dh_key = tuple(tuple(float(v) for v in params) for params in dh_params)
+            if dh_key != self._last_q_dh:
+                self.reset_ik_warm_start()
+        
         if initial_guess is None:
-            initial_guess = [0.0] * n_joints
+            if dh_key is not None and self._last_q is not None:
+                initial_guess = self._last_q.copy()
+            else:
+                initial_guess = [0.0] * n_joints
+        elif len(initial_guess) != n_joints:
+            raise ValueError(f"initial_guess has {len(initial_guess)} values, expected {n_joints}")
         
         # 목표 동차 변환 행렬 구성
         target_T = self.create_target_transform_matrix(target_position, target_orientation)
         
         if method == 'numerical':
-            return self._inverse_kinematics_numerical_improved(dh_params, target_T, initial_guess)
+            solution = self._inverse_kinematics_numerical_improved(dh_params, target_T, initial_guess)
+            if dh_key is not None and solution is not None:
+                self._last_q = np.array(solution)
+                self._last_q_dh = dh_key
+            return solution
         elif method == 'analytical':
             return self._inverse_kinematics_analytical(dh_params, target_position, target_orientation)
         else:
             raise ValueError(f"Unknown method: {method}")
     
+    def reset_ik_warm_start(self):
+        """warm-start용으로 저장된 직전 역기구학 해 초기화"""
+        self._last_q = None
+        self._last_q_dh = None
+    
+    def set_ik_tolerances(self, ftol=None, xtol=None, max_nfev=None):
+        """수치 역기구학(least_squares)의 종료 조건 설정
+        
+        Args:
+            ftol (float): 비용 함수 변화량 허용 오차
+            xtol (float): 관절 각도 변화량 허용 오차
+            max_nfev (int): 최대 함수 평가 횟수
+        """
+        if ftol is not None:
+            self.ik_ftol = ftol
+        if xtol is not None:
+            self.ik_xtol = xtol
+        if max_nfev is not None:
+            self.ik_max_nfev = max_nfev
+    
     def create_target_transform_matrix(self, position, orientation=None):
         """목표 위치와 자세로부터 동차 변환 행렬 생성"""
-        T = np.eye(4)
+        T = np.zeros((4, 4))
+        T[3, 3] = 1.0
         T[:3, 3] = position
         
         if orientation is not None:
             roll, pitch, yaw = orientation
             
-            # 회전 행렬 계산 (ZYX Euler angles)
-            R_z = np.array([[np.cos(yaw), -np.sin(yaw), 0],
-                           [np.sin(yaw),  np.cos(yaw), 0],
-                           [0,            0,           1]])
-            
-            R_y = np.array([[np.cos(pitch),  0, np.sin(pitch)],
-                           [0,              1, 0],
-                           [-np.sin(pitch), 0, np.cos(pitch)]])
-            
-            R_x = np.array([[1, 0,             0],
-                           [0, np.cos(roll), -np.sin(roll)],
-                           [0, np.sin(roll),  np.cos(roll)]])
+            cr, sr = np.cos(roll), np.sin(roll)
+            cp, sp = np.cos(pitch), np.sin(pitch)
+            cy, sy = np.cos(yaw), np.sin(yaw)
             
-            R = np.dot(R_z, np.dot(R_y, R_x))
-            T[:3, :3] = R
+            # 회전 행렬 계산 (ZYX Euler angles): R = R_z(yaw) @ R_y(pitch) @ R_x(roll) 전개식
+            T[:3, :3] = [[cy * cp, cy * sp * sr - sy * cr, cy * sp * cr + sy * sr],
+                         [sy * cp, sy * sp * sr + cy * cr, sy * sp * cr - cy * sr],
+                         [-sp,     cp * sr,                cp * cr]]
+        else:
+            T[0, 0] = T[1, 1] = T[2, 2] = 1.0
         
         return T
     
@@ -245,209 +366,177 @@ class RobotKinematics:
         
         def objective_function(joint_angles):
             """목적 함수 - 위치와 자세 오차의 제곱합"""
-            try:
-                current_T = self.forward_kinematics(dh_params, joint_angles)
-                
-                # 위치 오차
-                pos_error = target_T[:3, 3] - current_T[:3, 3]
-                
-                # 자세 오차 (회전 행렬 차이)
-                if target_T.shape == (4, 4) and n_joints >= 3:
-                    R_target = target_T[:3, :3]
-                    R_current = current_T[:3, :3]
-                    R_error = np.dot(R_target, R_current.T)
-                    
-                    # 회전 행렬을 축-각 표현으로 변환하여 오차 계산
-                    trace_R = np.trace(R_error)
-                    trace_R = np.clip(trace_R, -1, 3)
-                    
-                    if trace_R >= 3:
-                        angle_error = 0.0
-                    else:
-                        angle_error = np.arccos((trace_R - 1) / 2)
-                    
-                    # 회전축 계산
-                    if abs(angle_error) > 1e-6:
-                        axis_error = np.array([
-                            R_error[2, 1] - R_error[1, 2],
-                            R_error[0, 2] - R_error[2, 0], 
-                            R_error[1, 0] - R_error[0, 1]
-                        ]) / (2 * np.sin(angle_error))
-                        rot_error = axis_error * angle_error
-                    else:
-                        rot_error = np.zeros(3)
-                else:
-                    rot_error = np.zeros(3)
-                
-                # 전체 오차 벡터
-                error_vector = np.concatenate([pos_error * 10, rot_error])
-                return np.sum(error_vector**2)
-                
-            except Exception as e:
-                return 1e6
-        
-        def residual_function(joint_angles):
-            """잔차 함수 - least_squares용"""
-            try:
-                current_T = self.forward_kinematics(dh_params, joint_angles)
-                
-                # 위치 오차
-                pos_error = target_T[:3, 3] - current_T[:3, 3]
-                
-                # 자세 오차
-                if n_joints >= 3 and target_T.shape == (4, 4):
-                    z_target = target_T[:3, 2]
-                    z_current = current_T[:3, 2]
-                    z_error = z_target - z_current
-                    
-                    if n_joints >= 6:
-                        x_target = target_T[:3, 0]
-                        x_current = current_T[:3, 0]
-                        x_error = x_target - x_current
-                        return np.concatenate([pos_error, z_error, x_error])
-                    else:
-                        return np.concatenate([pos_error, z_error])
-                else:
-                    if n_joints == 1:
-                        return [pos_error[0]]
-                    elif n_joints == 2:
-                        return pos_error[:2]
-                    else:
-                        return pos_error
-                        
-            except Exception as e:
-                if n_joints == 1:
-                    return [1000.0]
-                elif n_joints == 2:
-                    return [1000.0, 1000.0]
-                elif n_joints == 3:
-                    return [1000.0, 1000.0, 1000.0, 0.0, 0.0, 0.0]
-                else:
-                    return [1000.0] * (3 + min(n_joints - 3, 3))
-        
-        try:
-            # 관절 제한 설정
-            bounds = []
-            for i in range(len(initial_guess)):
-                if i in self.joint_limits:
-                    min_angle, max_angle = self.joint_limits[i]
-                    bounds.append((np.radians(min_angle), np.radians(max_angle)))
-                else:
-                    bounds.append((-np.pi, np.pi))
-            
-            # Method 1: scipy.optimize.minimize 사용
-            result1 = minimize(objective_function, initial_guess, 
-                             method='L-BFGS-B', bounds=bounds)
+            current_T = self.forward_kinematics(dh_params, joint_angles, dtype=np.float64)
             
-            if result1.success and result1.fun < 1e-4:
-                return result1.x.tolist()
-            
-            # Method 2: scipy.optimize.least_squares 사용
-            result2 = least_squares(residual_function, initial_guess, 
-                                  bounds=([b[0] for b in bounds], [b[1] for b in bounds]))
+            # 위치 오차
+            pos_error = target_T[:3, 3] - current_T[:3, 3]
             
-            if result2.success and result2.cost < 1e-4:
-                return result2.x.tolist()
+            # 자세 오차 (회전 행렬 차이)
+            if target_T.shape == (4, 4) and n_joints >= 3:
+                R_target = target_T[:3, :3]
+                R_current = current_T[:3, :3]
+                R_error = np.dot(R_target, R_current.T)
+                
+                # 회전 행렬을 회전 벡터(축 * 각도)로 변환하여 오차 계산
+                rot_error = self._rotmat_to_rotvec(R_error)
+            else:
+                rot_error = np.zeros(3)
             
-            # Method 3: fsolve 시도
-            if n_joints <= 3:
-                try:
-                    with warnings.catch_warnings():
-                        warnings.simplefilter("ignore")
-                        solution = fsolve(self._ik_equations_improved, initial_guess, 
-                                        args=(dh_params, target_T))
-                    
-                    if self._verify_ik_solution(solution, dh_params, target_T):
-                        return solution.tolist()
-                except:
-                    pass
+            # 전체 오차 벡터
+            error_vector = np.concatenate([pos_error * 10, rot_error])
+            return np.sum(error_vector**2)
+        
+        # 잔차 함수 - least_squares용
+        # 관절 수에 따른 잔차 구성은 호출마다 분기하지 않고 여기서 한 번만 선택한다.
+        # least_squares는 이전 잔차 배열을 보관하므로 호출마다 새 배열을 반환해야 한다.
+        forward_kinematics = self.forward_kinematics
+        target_pos = target_T[:3, 3]
+        z_target = target_T[:3, 2]
+        x_target = target_T[:3, 0]
+        
+        if n_joints >= 6:
+            def residual_function(joint_angles):
+                """잔차: 위치 + z축 + x축 오차"""
+                current_T = forward_kinematics(dh_params, joint_angles, dtype=np.float64)
+                residual = np.empty(9)
+                residual[0:3] = target_pos - current_T[:3, 3]
+                residual[3:6] = z_target - current_T[:3, 2]
+                residual[6:9] = x_target - current_T[:3, 0]
+                return residual
+        elif n_joints >= 3:
+            def residual_function(joint_angles):
+                """잔차: 위치 + z축 오차"""
+                current_T = forward_kinematics(dh_params, joint_angles, dtype=np.float64)
+                residual = np.empty(6)
+                residual[0:3] = target_pos - current_T[:3, 3]
+                residual[3:6] = z_target - current_T[:3, 2]
+                return residual
+        else:
+            def residual_function(joint_angles):
+                """잔차: 평면 위치 오차 (1DOF는 x, 2DOF는 x, y)"""
+                current_T = forward_kinematics(dh_params, joint_angles, dtype=np.float64)
+                return target_pos[:n_joints] - current_T[:n_joints, 3]
+        
+        # 관절 제한 설정 (초기 추정값은 제한 범위 안으로 투영)
+        lower_bounds, upper_bounds = self._joint_limit_arrays(n_joints)
+        initial_guess = np.clip(np.asarray(initial_guess, dtype=np.float64), lower_bounds, upper_bounds)
+        bounds = list(zip(lower_bounds, upper_bounds))
+        
+        # Method 1: scipy.optimize.minimize 사용
+        result1 = minimize(objective_function, initial_guess, 
+                         method='L-BFGS-B', bounds=bounds)
+        
+        if result1.success and result1.fun < 1e-4:
+            return result1.x.tolist()
+        
+        # Method 2: scipy.optimize.least_squares 사용
+        result2 = least_squares(residual_function, initial_guess, 
+                              bounds=(lower_bounds, upper_bounds),
+                              ftol=self.ik_ftol, xtol=self.ik_xtol, max_nfev=self.ik_max_nfev)
+        
+        if result2.success and result2.cost < 1e-4:
+            return result2.x.tolist()
+        
+        # Method 3: fsolve 시도
+        if n_joints <= 3:
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore")
+                solution = fsolve(self._ik_equations_improved, initial_guess, 
+                                args=(dh_params, target_T))
             
-            return None
+            if self._verify_ik_solution(solution, dh_params, target_T):
+                return solution.tolist()
         
-        except Exception as e:
-            print(f"Numerical IK error: {e}")
-            return None
+        return None
     
     def _ik_equations_improved(self, joint_angles, dh_params, target_T):
         """개선된 역기구학 방정식 (fsolve용)"""
-        try:
-            n_joints = len(joint_angles)
-            current_T = self.forward_kinematics(dh_params, joint_angles)
+        n_joints = len(joint_angles)
+        current_T = self.forward_kinematics(dh_params, joint_angles, dtype=np.float64)
+        
+        # 위치 오차
+        pos_error = target_T[:3, 3] - current_T[:3, 3]
+        
+        if n_joints == 1:
+            return [pos_error[0]]
+        elif n_joints == 2:
+            return pos_error[:2].tolist()
+        elif n_joints == 3:
+            return pos_error.tolist()
+        elif n_joints == 4:
+            z_target = target_T[:3, 2]
+            z_current = current_T[:3, 2]
+            z_error = np.dot(z_target, z_current) - 1
+            return np.concatenate([pos_error, [z_error]]).tolist()
+        elif n_joints == 5:
+            z_target = target_T[:3, 2]
+            z_current = current_T[:3, 2]
+            z_error = np.dot(z_target, z_current) - 1
             
-            # 위치 오차
-            pos_error = target_T[:3, 3] - current_T[:3, 3]
+            y_target = target_T[:3, 1]
+            y_current = current_T[:3, 1]
+            y_error = np.dot(y_target, y_current) - 1
             
-            if n_joints == 1:
-                return [pos_error[0]]
-            elif n_joints == 2:
-                return pos_error[:2].tolist()
-            elif n_joints == 3:
-                return pos_error.tolist()
-            elif n_joints == 4:
-                z_target = target_T[:3, 2]
-                z_current = current_T[:3, 2]
-                z_error = np.dot(z_target, z_current) - 1
-                return np.concatenate([pos_error, [z_error]]).tolist()
-            elif n_joints == 5:
-                z_target = target_T[:3, 2]
-                z_current = current_T[:3, 2]
-                z_error = np.dot(z_target, z_current) - 1
-                
-                y_target = target_T[:3, 1]
-                y_current = current_T[:3, 1]
-                y_error = np.dot(y_target, y_current) - 1
-                
-                return np.concatenate([pos_error, [z_error, y_error]]).tolist()
-            elif n_joints >= 6:
-                # 회전 행렬 오차를 축-각 표현으로 변환
-                R_target = target_T[:3, :3]
-                R_current = current_T[:3, :3]
-                R_error = np.dot(R_target, R_current.T)
-                
-                trace_R = np.trace(R_error)
-                trace_R = np.clip(trace_R, -1, 3)
-                
-                if trace_R >= 2.99:
-                    rot_error = np.zeros(3)
-                else:
-                    angle = np.arccos((trace_R - 1) / 2)
-                    if abs(angle) < 1e-6:
-                        rot_error = np.zeros(3)
-                    else:
-                        axis = np.array([
-                            R_error[2, 1] - R_error[1, 2],
-                            R_error[0, 2] - R_error[2, 0],
-                            R_error[1, 0] - R_error[0, 1]
-                        ]) / (2 * np.sin(angle))
-                        rot_error = axis * angle
-                
-                return np.concatenate([pos_error, rot_error]).tolist()
-            else:
-                return pos_error.tolist()
-                
-        except Exception as e:
-            n_joints = len(joint_angles)
-            if n_joints == 1:
-                return [1000.0]
-            elif n_joints == 2:
-                return [1000.0, 1000.0]
-            elif n_joints == 3:
-                return [1000.0, 1000.0, 1000.0]
-            elif n_joints == 4:
-                return [1000.0, 1000.0, 1000.0, 1000.0]
-            elif n_joints == 5:
-                return [1000.0, 1000.0, 1000.0, 1000.0, 1000.0]
-            else:
-                return [1000.0, 1000.0, 1000.0, 1000.0, 1000.0, 1000.0]
+            return np.concatenate([pos_error, [z_error, y_error]]).tolist()
+        elif n_joints >= 6:
+            # 회전 행렬 오차를 축-각 표현으로 변환
+            R_target = target_T[:3, :3]
+            R_current = current_T[:3, :3]
+            R_error = np.dot(R_target, R_current.T)
+            rot_error = self._rotmat_to_rotvec(R_error)
+            
+            return np.concatenate([pos_error, rot_error]).tolist()
+        else:
+            return pos_error.tolist()
+    
+    def _rotmat_to_rotvec(self, R):
+        """회전 행렬을 회전 벡터(축 * 각도)로 변환
+        
+        Shepperd 방법으로 쿼터니언을 구한 뒤 쿼터니언 로그를 취하므로
+        0과 π 근처에서도 arccos/sin 나눗셈 없이 안정적으로 계산된다.
+        
+        Args:
+            R (numpy.ndarray): 3x3 회전 행렬
+            
+        Returns:
+            numpy.ndarray: 회전 벡터 (라디안)
+        """
+        trace_R = R[0, 0] + R[1, 1] + R[2, 2]
+        
+        # 상쇄 오차를 피하기 위해 가장 큰 대각 성분 기준으로 쿼터니언 계산
+        k = np.argmax([trace_R, R[0, 0], R[1, 1], R[2, 2]])
+        if k == 0:
+            w = 0.5 * np.sqrt(1.0 + trace_R)
+            xyz = np.array([R[2, 1] - R[1, 2], R[0, 2] - R[2, 0], R[1, 0] - R[0, 1]]) / (4.0 * w)
+        elif k == 1:
+            x = 0.5 * np.sqrt(1.0 + R[0, 0] - R[1, 1] - R[2, 2])
+            w = (R[2, 1] - R[1, 2]) / (4.0 * x)
+            xyz = np.array([x, (R[0, 1] + R[1, 0]) / (4.0 * x), (R[0, 2] + R[2, 0]) / (4.0 * x)])
+        elif k == 2:
+            y = 0.5 * np.sqrt(1.0 - R[0, 0] + R[1, 1] - R[2, 2])
+            w = (R[0, 2] - R[2, 0]) / (4.0 * y)
+            xyz = np.array([(R[0, 1] + R[1, 0]) / (4.0 * y), y, (R[1, 2] + R[2, 1]) / (4.0 * y)])
+        else:
+            z = 0.5 * np.sqrt(1.0 - R[0, 0] - R[1, 1] + R[2, 2])
+            w = (R[1, 0] - R[0, 1]) / (4.0 * z)
+            xyz = np.array([(R[0, 2] + R[2, 0]) / (4.0 * z), (R[1, 2] + R[2, 1]) / (4.0 * z), z])
+        
+        # q와 -q는 같은 회전이므로 w >= 0 인 쪽을 사용 (최단 회전)
+        if w < 0:
+            w = -w
+            xyz = -xyz
+        
+        # 쿼터니언 로그: 2 * atan2(|xyz|, w) * xyz / |xyz|
+        s = np.sqrt(np.dot(xyz, xyz))
+        if s < 1e-12:
+            return 2.0 * xyz / w
+        return (2.0 * np.arctan2(s, w) / s) * xyz
     
     def _verify_ik_solution(self, solution, dh_params, target_T, tolerance=1e-3):
         """역기구학 해의 검증"""
-        try:
-            current_T = self.forward_kinematics(dh_params, solution)
-            pos_error = np.linalg.norm(target_T[:3, 3] - current_T[:3, 3])
-            return pos_error < tolerance
-        except:
-            return False
+        current_T = self.forward_kinematics(dh_params, solution, dtype=np.float64)
+        pos_error = np.linalg.norm(target_T[:3, 3] - current_T[:3, 3])
+        return pos_error < tolerance
     
     def _inverse_kinematics_analytical(self, dh_params, target_position, target_orientation):
         """해석적 역기구학 해법 (특정 로봇 구조에 대해)"""
@@ -462,40 +551,48 @@ class RobotKinematics:
                 self.create_target_transform_matrix(target_position, target_orientation), 
                 [0.0] * n_joints)
     
+    def _planar_link_constants(self, dh_params):
+        """2DOF 평면 IK에 필요한 링크 상수 반환 (링크 길이별로 캐시)"""
+        key = (dh_params[0][0], dh_params[1][0])
+        constants = self._dh_cache_planar.get(key)
+        
+        if constants is None:
+            # 링크 길이 (cm를 m로 변환)
+            l1 = key[0] / 100.0
+            l2 = key[1] / 100.0
+            constants = (l1, l2, l1 * l1, l2 * l2, 2 * l1 * l2, (l1 + l2)**2, (l1 - l2)**2)
+            self._dh_cache_planar[key] = constants
+        
+        return constants
+    
     def _2dof_planar_ik(self, dh_params, target_position):
         """2DOF 평면 로봇의 해석적 역기구학"""
         x, y = target_position[0], target_position[1]
+        l1, l2, l1_sq, l2_sq, l1_l2_2, l1p_l2_sq, l1m_l2_sq = self._planar_link_constants(dh_params)
         
-        # 링크 길이 (cm를 m로 변환)
-        l1 = dh_params[0][0] / 100.0
-        l2 = dh_params[1][0] / 100.0
-        
-        # 목표점까지의 거리
-        r = np.sqrt(x**2 + y**2)
+        # 목표점까지의 거리 제곱
+        r2 = x * x + y * y
         
-        # 도달 가능성 검사
-        if r > (l1 + l2) or r < abs(l1 - l2):
+        # 도달 가능성 검사: |l1 - l2| <= r <= l1 + l2
+        if (r2 - l1p_l2_sq) * (r2 - l1m_l2_sq) > 0:
             return None
         
-        # 코사인 법칙으로 θ2 계산
-        cos_theta2 = (x**2 + y**2 - l1**2 - l2**2) / (2 * l1 * l2)
+        # 코사인 법칙으로 θ2 계산 (수치 오차는 클리핑으로 처리)
+        cos_theta2 = np.clip((r2 - l1_sq - l2_sq) / l1_l2_2, -1.0, 1.0)
         
-        # 수치 오차 처리
-        if abs(cos_theta2) > 1:
-            cos_theta2 = np.sign(cos_theta2)
+        # cos(θ2)는 두 해에서 같으므로 분모도 같다
+        denominator = l1 + l2 * cos_theta2
+        if abs(denominator) <= 1e-6:
+            return None
         
-        # 두 가지 해 (팔꿈치 위/아래)
-        theta2_1 = np.arccos(cos_theta2)
-        theta2_2 = -theta2_1
+        # 두 가지 해 (팔꿈치 위/아래)를 한 번에 계산
+        theta2 = np.arccos(cos_theta2) * np.array([1.0, -1.0])
+        theta1 = np.arctan2(y, x) - np.arctan2(l2 * np.sin(theta2), denominator)
+        candidates = np.stack([theta1, theta2], axis=1)
         
-        # θ1 계산
-        for theta2 in [theta2_1, theta2_2]:
-            denominator = l1 + l2 * np.cos(theta2)
-            if abs(denominator) > 1e-6:
-                theta1 = np.arctan2(y, x) - np.arctan2(l2 * np.sin(theta2), denominator)
-                
-                if self._check_joint_limits([theta1, theta2]):
-                    return [theta1, theta2]
+        valid = self._check_joint_limits(candidates)
+        if valid.any():
+            return candidates[np.argmax(valid)].tolist()
         
         return None
     
@@ -509,62 +606,47 @@ class RobotKinematics:
         return None
     
     def _check_joint_limits(self, joint_angles):
-        """관절 제한 검사"""
-        for i, angle in enumerate(joint_angles):
-            if i in self.joint_limits:
-                min_limit, max_limit = self.joint_limits[i]
-                angle_deg = np.degrees(angle)
-                if angle_deg < min_limit or angle_deg > max_limit:
-                    return False
-        return True
+        """관절 제한 검사
+        
+        (N,) 관절 각도면 bool을, (K, N) 후보 배열이면 후보별 bool 마스크를 반환
+        """
+        q = np.asarray(joint_angles, dtype=np.float64)[..., :len(self._limits_lo_rad)]
+        n = q.shape[-1]
+        within = (q >= self._limits_lo_rad[:n]) & (q <= self._limits_hi_rad[:n])
+        
+        if q.ndim == 1:
+            return bool(np.all(within))
+        return np.all(within, axis=-1)
     
     def get_joint_limits(self, joint_index):
         """특정 관절의 제한값 반환"""
         return self.joint_limits.get(joint_index, (-180, 180))
     
-    def compute_workspace(self, dh_params, resolution=50):
+    def _joint_limit_arrays(self, n_joints):
+        """n개 관절의 제한값 배열 (라디안) 반환 - 제한이 없는 관절은 [-π, π]"""
+        lo = np.full(n_joints, -np.pi)
+        hi = np.full(n_joints, np.pi)
+        k = min(n_joints, len(self._limits_lo_rad))
+        lo[:k] = self._limits_lo_rad[:k]
+        hi[:k] = self._limits_hi_rad[:k]
+        return lo, hi
+    
+    def compute_workspace(self, dh_params, resolution=50, n_samples=1000):
         """로봇의 작업 공간 계산"""
         n_joints = len(dh_params)
-        workspace_points = []
+        lo, hi = self._joint_limit_arrays(n_joints)
         
-        # 각 관절의 각도 범위를 균등 분할
-        angle_ranges = []
-        for i in range(n_joints):
-            if i in self.joint_limits:
-                min_angle, max_angle = self.joint_limits[i]
-            else:
-                min_angle, max_angle = -180, 180
-            
-            angles = np.linspace(np.radians(min_angle), np.radians(max_angle), resolution)
-            angle_ranges.append(angles)
-        
-        # 모든 관절 각도 조합에 대해 end-effector 위치 계산
-        if n_joints == 1:
-            for angle1 in angle_ranges[0]:
-                T = self.forward_kinematics(dh_params, [angle1])
-                workspace_points.append(T[:3, 3])
-        elif n_joints == 2:
-            for angle1 in angle_ranges[0]:
-                for angle2 in angle_ranges[1]:
-                    T = self.forward_kinematics(dh_params, [angle1, angle2])
-                    workspace_points.append(T[:3, 3])
-        elif n_joints >= 3:
-            # 3DOF 이상은 샘플링 수를 줄여서 계산
-            reduced_resolution = min(resolution, 20)
-            for i in range(n_joints):
-                angle_ranges[i] = np.linspace(np.radians(-90), np.radians(90), reduced_resolution)
-            
-            # 랜덤 샘플링으로 작업공간 추정
-            for _ in range(1000):
-                joint_angles = []
-                for i in range(n_joints):
-                    angle = np.random.choice(angle_ranges[i])
-                    joint_angles.append(angle)
-                
-                T = self.forward_kinematics(dh_params, joint_angles)
-                workspace_points.append(T[:3, 3])
+        if n_joints <= 2:
+            # 모든 관절 각도 조합 (격자)에 대해 end-effector 위치를 한 번에 계산
+            angle_ranges = [np.linspace(lo[i], hi[i], resolution) for i in range(n_joints)]
+            grid = np.meshgrid(*angle_ranges, indexing='ij')
+            joint_angles_batch = np.stack([g.ravel() for g in grid], axis=1)
+        else:
+            # 3DOF 이상은 관절 제한 범위 내 랜덤 샘플링으로 작업공간 추정
+            joint_angles_batch = np.random.uniform(lo, hi, (n_samples, n_joints))
         
-        return np.array(workspace_points)
+        T_all = self.forward_kinematics_batch(dh_params, joint_angles_batch)
+        return T_all[:, :3, 3].copy()
     
     def compute_manipulability(self, jacobian):
         """조작성 지수 계산"""
@@ -574,7 +656,7 @@ class RobotKinematics:
                 manipulability = np.sqrt(np.linalg.det(JJT))
             else:
                 manipulability = abs(np.linalg.det(jacobian))
-        except:
+        except np.linalg.LinAlgError:
             manipulability = 0.0
         
         return manipulability
@@ -589,17 +671,6 @@ class RobotKinematics:
         Returns:
             list: 각 링크의 누적 변환 행렬 리스트
         """
-        transformation_matrices = [np.eye(4)]
-        T_cumulative = np.eye(4)
-        
-        for i, (dh_param, joint_angle) in enumerate(zip(dh_params, joint_angles)):
-            a, alpha_deg, d, theta_offset_deg = dh_param
-            alpha = np.radians(alpha_deg)
-            theta_offset = np.radians(theta_offset_deg)
-            theta = joint_angle + theta_offset
-            
-            T_i = self.dh_transform_matrix(a, alpha, d, theta)
-            T_cumulative = np.dot(T_cumulative, T_i)
-            transformation_matrices.append(T_cumulative.copy())
+        transformation_matrices = list(self._cumulative_transforms(dh_params, joint_angles))
         
         return transformation_matrices
\ No newline at end of file
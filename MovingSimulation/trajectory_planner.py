@@ -11,9 +11,39 @@ trajectory_planner.py - MovingSimulation/trajectory_planner.py
 import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib.gridspec import GridSpec
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
 import os
+from collections import OrderedDict
 from datetime import datetime
 
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+RAD2DEG = 180.0 / np.pi
+
+
+if NUMBA_AVAILABLE:
+    # parallel 커널은 cache=True를 쓰지 않음 (디스크 캐시가 처음 컴파일한 모듈 이름에 묶여
+    # 'trajectory_planner' / 'MovingSimulation.trajectory_planner' 중 다른 이름으로 쓰면 실패함)
+    @njit(parallel=True, fastmath=True)
+    def _eval_quintic_kernel(coefficients, time_array, positions, velocities, accelerations, jerks):
+        """관절별 5차 다항식 계산 커널 (Numba, 관절 단위 병렬화, 출력은 (n_joints, n_steps))"""
+        for j in prange(coefficients.shape[0]):
+            a0, a1, a2, a3, a4, a5 = (coefficients[j, 0], coefficients[j, 1], coefficients[j, 2],
+                                      coefficients[j, 3], coefficients[j, 4], coefficients[j, 5])
+            for i in range(time_array.shape[0]):
+                t = time_array[i]
+                t2 = t * t
+                t4 = t2 * t2
+                positions[j, i] = (a0 + a1*t) + t2*(a2 + a3*t) + t4*(a4 + a5*t)
+                velocities[j, i] = (a1 + 2*a2*t) + t2*(3*a3 + 4*a4*t) + t4*(5*a5)
+                accelerations[j, i] = (2*a2 + 6*a3*t) + t2*(12*a4 + 20*a5*t)
+                jerks[j, i] = 6*a3 + t*(24*a4 + 60*a5*t)
+
 class TrajectoryPlanner:
     def __init__(self):
         """궤적 계획기 초기화"""
@@ -21,6 +51,11 @@ class TrajectoryPlanner:
         self.default_duration = 5.0
         self.default_dt = 0.01
         
+        # (duration, dt)별 시간 배열과 거듭제곱 캐시 (관절 각도와 무관하므로 재사용 가능)
+        # optimize_trajectory_time 등은 연속적인 duration을 만들므로 최근 항목만 유지 (LRU)
+        self._time_basis_cache = OrderedDict()
+        self.TIME_BASIS_CACHE_SIZE = 32
+        
         # 그래프 스타일 설정
         plt.style.use('default')
         self.colors = ['#1f77b4', '#ff7f0e', '#2ca02c', '#d62728', '#9467bd', '#8c564b']
@@ -34,6 +69,8 @@ class TrajectoryPlanner:
             duration = self.default_duration
         if dt is None:
             dt = self.default_dt
+        if duration <= 0:
+            raise ValueError("궤적 시간은 0보다 커야 합니다")
             
         n_joints = len(start_angles)
         
@@ -47,61 +84,19 @@ class TrajectoryPlanner:
         if end_accelerations is None:
             end_accelerations = [0.0] * n_joints
             
-        # 시간 배열 생성
-        time_array = np.arange(0, duration + dt, dt)
-        n_steps = len(time_array)
-        
-        # 궤적 배열 초기화
-        positions = np.zeros((n_steps, n_joints))
-        velocities = np.zeros((n_steps, n_joints))
-        accelerations = np.zeros((n_steps, n_joints))
-        jerks = np.zeros((n_steps, n_joints))
-        coefficients = np.zeros((n_joints, 6))
-        
-        # 각 관절에 대해 5차 다항식 계수 계산
-        for joint_idx in range(n_joints):
-            θ0 = start_angles[joint_idx]
-            θf = end_angles[joint_idx]
-            ω0 = start_velocities[joint_idx]
-            ωf = end_velocities[joint_idx]
-            α0 = start_accelerations[joint_idx]
-            αf = end_accelerations[joint_idx]
-            T = duration
-            
-            # 5차 다항식의 계수 계산
-            A = np.array([
-                [1,  0,   0,    0,     0,     0],
-                [0,  1,   0,    0,     0,     0],
-                [0,  0,   2,    0,     0,     0],
-                [1,  T,   T**2, T**3,  T**4,  T**5],
-                [0,  1,   2*T,  3*T**2, 4*T**3, 5*T**4],
-                [0,  0,   2,    6*T,   12*T**2, 20*T**3]
-            ])
-            
-            b = np.array([θ0, ω0, α0, θf, ωf, αf])
-            
-            # 계수 계산
-            try:
-                joint_coeffs = np.linalg.solve(A, b)
-                coefficients[joint_idx] = joint_coeffs
-            except np.linalg.LinAlgError:
-                joint_coeffs = np.linalg.pinv(A) @ b
-                coefficients[joint_idx] = joint_coeffs
-            
-            # 시간에 따른 위치, 속도, 가속도, 저크 계산
-            a0, a1, a2, a3, a4, a5 = joint_coeffs
-            
-            for i, t in enumerate(time_array):
-                positions[i, joint_idx] = (a0 + a1*t + a2*t**2 + 
-                                         a3*t**3 + a4*t**4 + a5*t**5)
-                
-                velocities[i, joint_idx] = (a1 + 2*a2*t + 3*a3*t**2 + 
-                                          4*a4*t**3 + 5*a5*t**4)
-                
-                accelerations[i, joint_idx] = (2*a2 + 6*a3*t + 
-                                             12*a4*t**2 + 20*a5*t**3)
-                
-                jerks[i, joint_idx] = 6*a3 + 24*a4*t + 60*a5*t**2
+        # 시간 배열 생성 (캐시된 기저는 읽기 전용이므로 반환용 시간 배열은 복사)
+        time_basis = self._time_basis(duration, dt)
+        time_array = time_basis[0].copy()
+        
+        # 5차 다항식의 계수 계산 (경계 조건에 대한 폐형식 해, 모든 관절 동시 계산)
+        coefficients = self._quintic_coefficients(
+            start_angles, end_angles, start_velocities, end_velocities,
+            start_accelerations, end_accelerations, duration
+        )
+        
+        # 시간에 따른 위치, 속도, 가속도, 저크 계산 (n_steps, n_joints)
+        positions, velocities, accelerations, jerks = self._evaluate_quintic(
+            coefficients, time_basis[0], time_powers=time_basis[1:])
         
         return {
             'time': time_array,
@@ -114,6 +109,161 @@ class TrajectoryPlanner:
             'n_joints': n_joints
         }
     
+    def plan_quintic_trajectory_with_fk(self, start_angles, end_angles, fk_fn, duration=None, dt=None,
+                                        batch=False, **boundary_conditions):
+        """5차 다항식 궤적 계획과 끝단 위치 계산을 함께 수행
+        
+        Args:
+            start_angles, end_angles: 시작/목표 관절 각도 [rad]
+            fk_fn (callable): 관절 각도 → 끝단 위치(xyz) 또는 4x4 변환 행렬
+            duration (float): 궤적 시간 [s]
+            dt (float): 시간 간격 [s]
+            batch (bool): True이면 fk_fn에 (n_steps, n_joints) 전체 배열을 한 번에 전달
+                (예: RobotKinematics.forward_kinematics_batch)
+            **boundary_conditions: plan_quintic_trajectory의 속도/가속도 경계 조건
+            
+        Returns:
+            dict: plan_quintic_trajectory 결과에 'end_effector' (n_steps, 3) 추가
+        """
+        trajectory = self.plan_quintic_trajectory(start_angles, end_angles, duration, dt,
+                                                  **boundary_conditions)
+        positions = trajectory['positions']
+        
+        if batch:
+            result = np.asarray(fk_fn(positions), dtype=float)
+            end_effector = result[:, :3, 3] if result.ndim == 3 else result[:, :3]
+        else:
+            # 미리 할당한 버퍼에 시간 스텝별 끝단 위치를 바로 기록
+            end_effector = np.empty((len(positions), 3))
+            for i, joint_angles in enumerate(positions):
+                result = np.asarray(fk_fn(joint_angles), dtype=float)
+                end_effector[i] = result[:3, 3] if result.ndim == 2 else result[:3]
+        
+        trajectory['end_effector'] = end_effector
+        return trajectory
+    
+    def _time_array(self, duration, dt):
+        """[0, duration] 구간을 dt 간격으로 나눈 시간 배열 생성
+        
+        np.arange는 부동소수점 누적 오차로 마지막 샘플 포함 여부가 달라질 수 있으므로
+        스텝 수를 먼저 정한 뒤 np.linspace로 생성한다.
+        
+        Args:
+            duration (float): 궤적 시간 [s]
+            dt (float): 시간 간격 [s]
+            
+        Returns:
+            numpy.ndarray: (n_steps,) 시간 배열, n_steps = round(duration/dt) + 1
+        """
+        return self._time_basis(duration, dt)[0]
+    
+    def _time_basis(self, duration, dt):
+        """(duration, dt)에 대한 시간 배열과 거듭제곱 (t, t², t⁴)을 캐시에서 가져오거나 생성
+        
+        Args:
+            duration (float): 궤적 시간 [s]
+            dt (float): 시간 간격 [s]
+            
+        Returns:
+            tuple: (t, t2, t4), 각각 읽기 전용 (n_steps,) 배열
+        """
+        key = (duration, dt)
+        basis = self._time_basis_cache.get(key)
+        if basis is not None:
+            self._time_basis_cache.move_to_end(key)
+        else:
+            n_steps = int(round(duration / dt)) + 1
+            t = np.linspace(0.0, duration, n_steps)
+            t2 = t * t
+            t4 = t2 * t2
+            for arr in (t, t2, t4):
+                arr.flags.writeable = False
+            basis = self._time_basis_cache[key] = (t, t2, t4)
+            if len(self._time_basis_cache) > self.TIME_BASIS_CACHE_SIZE:
+                self._time_basis_cache.popitem(last=False)
+        return basis
+    
+    def _quintic_coefficients(self, θ0, θf, ω0, ωf, α0, αf, T):
+        """경계 조건으로부터 5차 다항식 계수를 폐형식으로 계산
+        
+        Args:
+            θ0, θf: 시작/종료 위치 (..., n_joints)
+            ω0, ωf: 시작/종료 속도 (..., n_joints)
+            α0, αf: 시작/종료 가속도 (..., n_joints)
+            T: 구간 시간 (스칼라 또는 (..., 1)로 브로드캐스트 가능한 배열)
+            
+        Returns:
+            numpy.ndarray: (..., n_joints, 6) 다항식 계수 [a0, ..., a5]
+        """
+        θ0 = np.asarray(θ0, dtype=float)
+        θf = np.asarray(θf, dtype=float)
+        ω0 = np.asarray(ω0, dtype=float)
+        ωf = np.asarray(ωf, dtype=float)
+        α0 = np.asarray(α0, dtype=float)
+        αf = np.asarray(αf, dtype=float)
+        Δθ = θf - θ0
+        # 거듭제곱은 pow 대신 이전 값에 곱해 누적 계산
+        T2 = T * T
+        T3 = T2 * T
+        T4 = T2 * T2
+        T5 = T4 * T
+        
+        return np.stack(np.broadcast_arrays(
+            θ0,
+            ω0,
+            α0 / 2,
+            (20*Δθ - (8*ωf + 12*ω0)*T - (3*α0 - αf)*T2) / (2*T3),
+            (-30*Δθ + (14*ωf + 16*ω0)*T + (3*α0 - 2*αf)*T2) / (2*T4),
+            (12*Δθ - 6*(ωf + ω0)*T - (α0 - αf)*T2) / (2*T5)
+        ), axis=-1)
+    
+    def _evaluate_quintic(self, coefficients, time_array, time_powers=None):
+        """5차 다항식과 그 도함수들을 Estrin 방식으로 계산
+        
+        Horner 방식은 곱셈이 직렬로 의존하지만, Estrin 방식은 (a0 + a1·t), t²·(a2 + a3·t),
+        t⁴·(a4 + a5·t) 처럼 서로 독립적인 항으로 나누어 명령어 수준 병렬성을 높인다.
+        Numba가 설치되어 있으면 컴파일된 커널을 사용한다.
+        
+        Args:
+            coefficients (numpy.ndarray): (n_joints, 6) 또는 시간별 (n_steps, n_joints, 6) 계수
+            time_array (numpy.ndarray): (n_steps,) 시간 배열
+            time_powers (tuple): 미리 계산된 (t², t⁴) (생략 시 계산)
+            
+        Returns:
+            tuple: (positions, velocities, accelerations, jerks), 각각 (n_steps, n_joints)
+                내부적으로는 관절별 데이터가 연속되도록 (n_joints, n_steps)로 계산하고
+                전치 뷰(.T)를 반환한다.
+        """
+        if NUMBA_AVAILABLE and coefficients.ndim == 2:
+            n_steps, n_joints = len(time_array), len(coefficients)
+            positions = np.empty((n_joints, n_steps))
+            velocities = np.empty((n_joints, n_steps))
+            accelerations = np.empty((n_joints, n_steps))
+            jerks = np.empty((n_joints, n_steps))
+            _eval_quintic_kernel(np.ascontiguousarray(coefficients, dtype=np.float64),
+                                 np.ascontiguousarray(time_array, dtype=np.float64),
+                                 positions, velocities, accelerations, jerks)
+            return positions.T, velocities.T, accelerations.T, jerks.T
+        
+        t = time_array[np.newaxis, :]
+        if time_powers is None:
+            t2 = t * t
+            t4 = t2 * t2
+        else:
+            t2, t4 = (p[np.newaxis, :] for p in time_powers)
+        if coefficients.ndim == 2:
+            a0, a1, a2, a3, a4, a5 = coefficients.T[:, :, np.newaxis]
+        else:
+            a0, a1, a2, a3, a4, a5 = np.ascontiguousarray(np.transpose(coefficients, (2, 1, 0)))
+        
+        positions = (a0 + a1*t) + t2*(a2 + a3*t) + t4*(a4 + a5*t)
+        velocities = (a1 + 2*a2*t) + t2*(3*a3 + 4*a4*t) + t4*(5*a5)
+        accelerations = (2*a2 + 6*a3*t) + t2*(12*a4 + 20*a5*t)
+        jerks = 6*a3 + t*(24*a4 + 60*a5*t)
+        
+        positions, velocities, accelerations, jerks = positions.T, velocities.T, accelerations.T, jerks.T
+        return positions, velocities, accelerations, jerks
+    
     def plan_multi_point_trajectory(self, waypoints, durations=None, dt=None):
         """다중 점을 거치는 궤적 계획"""
         n_segments = len(waypoints) - 1
@@ -128,64 +278,40 @@ class TrajectoryPlanner:
         if dt is None:
             dt = self.default_dt
         
-        # 전체 궤적 데이터 초기화
-        all_time = []
-        all_positions = []
-        all_velocities = []
-        all_accelerations = []
-        all_jerks = []
-        
-        current_time_offset = 0
-        
-        # 각 구간별로 궤적 계획
-        for segment_idx in range(n_segments):
-            start_angles = waypoints[segment_idx]
-            end_angles = waypoints[segment_idx + 1]
-            segment_duration = durations[segment_idx]
-            
-            # 중간 웨이포인트에서는 속도를 0으로 설정하여 정지
-            start_vel = [0.0] * len(start_angles)
-            end_vel = [0.0] * len(end_angles)
-            
-            # 구간 궤적 계획
-            segment_traj = self.plan_quintic_trajectory(
-                start_angles, end_angles, segment_duration, dt,
-                start_vel, end_vel
-            )
-            
-            # 시간 오프셋 적용
-            segment_time = segment_traj['time'] + current_time_offset
-            
-            # 첫 번째 구간이 아니면 시작점 중복 제거
-            if segment_idx > 0:
-                segment_time = segment_time[1:]
-                segment_positions = segment_traj['positions'][1:]
-                segment_velocities = segment_traj['velocities'][1:]
-                segment_accelerations = segment_traj['accelerations'][1:]
-                segment_jerks = segment_traj['jerks'][1:]
-            else:
-                segment_positions = segment_traj['positions']
-                segment_velocities = segment_traj['velocities']
-                segment_accelerations = segment_traj['accelerations']
-                segment_jerks = segment_traj['jerks']
-            
-            # 전체 데이터에 추가
-            all_time.extend(segment_time)
-            all_positions.extend(segment_positions)
-            all_velocities.extend(segment_velocities)
-            all_accelerations.extend(segment_accelerations)
-            all_jerks.extend(segment_jerks)
-            
-            current_time_offset += segment_duration
+        # 모든 구간의 경계 조건을 (n_segments, n_joints)로 모아 한 번에 계수 계산
+        # 중간 웨이포인트에서는 속도/가속도를 0으로 설정하여 정지
+        waypoints = np.asarray(waypoints, dtype=float)
+        n_joints = waypoints.shape[1]
+        seg_durations = np.asarray(durations, dtype=float)
+        if np.any(seg_durations <= 0):
+            raise ValueError("궤적 시간은 0보다 커야 합니다")
+        # 0 경계 조건은 스칼라로 넘겨 브로드캐스트 (0으로 채운 배열을 따로 만들지 않음)
+        coefficients = self._quintic_coefficients(
+            waypoints[:-1], waypoints[1:], 0.0, 0.0, 0.0, 0.0,
+            seg_durations[:, np.newaxis]
+        )
+        
+        # 구간별 지역 시간 배열 (첫 번째 구간 이후에는 중복되는 시작점 제외)
+        local_times = [self._time_array(d, dt) for d in durations]
+        local_times = [local_times[0]] + [t[1:] for t in local_times[1:]]
+        seg_index = np.repeat(np.arange(n_segments), [len(t) for t in local_times])
+        local_time = np.concatenate(local_times)
+        
+        # 시간 오프셋 적용 후 샘플별 계수로 한 번에 평가
+        time_offsets = np.concatenate(([0.0], np.cumsum(seg_durations)[:-1]))
+        all_time = local_time + time_offsets[seg_index]
+        all_positions, all_velocities, all_accelerations, all_jerks = \
+            self._evaluate_quintic(coefficients[seg_index], local_time)
+        current_time_offset = sum(durations)
         
         return {
-            'time': np.array(all_time),
-            'positions': np.array(all_positions),
-            'velocities': np.array(all_velocities),
-            'accelerations': np.array(all_accelerations),
-            'jerks': np.array(all_jerks),
+            'time': all_time,
+            'positions': all_positions,
+            'velocities': all_velocities,
+            'accelerations': all_accelerations,
+            'jerks': all_jerks,
             'total_duration': current_time_offset,
-            'n_joints': len(waypoints[0]),
+            'n_joints': n_joints,
             'n_segments': n_segments
         }
     
@@ -218,23 +344,28 @@ class TrajectoryPlanner:
         
         return max(optimal_time, 1.0)
     
-    def plot_trajectory_graphs(self, trajectory_data, save_dir=None, filename_prefix="trajectory"):
-        """궤적 그래프 생성 및 저장"""
-        time = trajectory_data['time']
-        positions = trajectory_data['positions']
-        velocities = trajectory_data['velocities']
-        accelerations = trajectory_data['accelerations']
-        jerks = trajectory_data['jerks']
+    def plot_trajectory_graphs(self, trajectory_data, save_dir=None, filename_prefix="trajectory",
+                               dtype=np.float32):
+        """궤적 그래프 생성 및 저장 (그래프용 데이터는 기본적으로 float32로 변환)"""
+        time = np.asarray(trajectory_data['time'], dtype=dtype)
         n_joints = trajectory_data['n_joints']
         
+        # 라디안 → 도 변환을 배열 전체에 한 번만 수행 (dtype 변환과 함께)
+        positions_deg = np.multiply(trajectory_data['positions'], RAD2DEG, dtype=dtype)
+        velocities_deg = np.multiply(trajectory_data['velocities'], RAD2DEG, dtype=dtype)
+        accelerations_deg = np.multiply(trajectory_data['accelerations'], RAD2DEG, dtype=dtype)
+        jerks_deg = np.multiply(trajectory_data['jerks'], RAD2DEG, dtype=dtype)
+        
         # 그래프 설정
-        fig = plt.figure(figsize=(15, 12))
+        # pyplot 전역 figure 목록에 등록되지 않는 독립 Figure (Agg 캔버스로 렌더링)
+        fig = Figure(figsize=(15, 12))
+        FigureCanvasAgg(fig)
         gs = GridSpec(4, 1, hspace=0.3)
         
         # 1. 각도 그래프
         ax1 = fig.add_subplot(gs[0, 0])
         for joint_idx in range(n_joints):
-            ax1.plot(time, np.degrees(positions[:, joint_idx]), 
+            ax1.plot(time, positions_deg[:, joint_idx], 
                     color=self.colors[joint_idx % len(self.colors)],
                     linewidth=2, label=f'Joint {joint_idx + 1}')
         ax1.set_ylabel('각도 (deg)', fontsize=12)
@@ -245,7 +376,7 @@ class TrajectoryPlanner:
         # 2. 각속도 그래프
         ax2 = fig.add_subplot(gs[1, 0])
         for joint_idx in range(n_joints):
-            ax2.plot(time, np.degrees(velocities[:, joint_idx]), 
+            ax2.plot(time, velocities_deg[:, joint_idx], 
                     color=self.colors[joint_idx % len(self.colors)],
                     linewidth=2, label=f'Joint {joint_idx + 1}')
         ax2.set_ylabel('각속도 (deg/s)', fontsize=12)
@@ -256,7 +387,7 @@ class TrajectoryPlanner:
         # 3. 각가속도 그래프
         ax3 = fig.add_subplot(gs[2, 0])
         for joint_idx in range(n_joints):
-            ax3.plot(time, np.degrees(accelerations[:, joint_idx]), 
+            ax3.plot(time, accelerations_deg[:, joint_idx], 
                     color=self.colors[joint_idx % len(self.colors)],
                     linewidth=2, label=f'Joint {joint_idx + 1}')
         ax3.set_ylabel('각가속도 (deg/s²)', fontsize=12)
@@ -267,7 +398,7 @@ class TrajectoryPlanner:
         # 4. 저크 그래프
         ax4 = fig.add_subplot(gs[3, 0])
         for joint_idx in range(n_joints):
-            ax4.plot(time, np.degrees(jerks[:, joint_idx]), 
+            ax4.plot(time, jerks_deg[:, joint_idx], 
                     color=self.colors[joint_idx % len(self.colors)],
                     linewidth=2, label=f'Joint {joint_idx + 1}')
         ax4.set_xlabel('시간 (s)', fontsize=12)
@@ -276,7 +407,7 @@ class TrajectoryPlanner:
         ax4.grid(True, alpha=0.3)
         ax4.legend()
         
-        plt.tight_layout()
+        fig.tight_layout()
         
         # 파일 저장
         if save_dir:
@@ -285,7 +416,7 @@ class TrajectoryPlanner:
             filename = f"{filename_prefix}_{timestamp}.png"
             filepath = os.path.join(save_dir, filename)
             
-            plt.savefig(filepath, dpi=300, bbox_inches='tight', 
+            fig.savefig(filepath, dpi=300, bbox_inches='tight', 
                        facecolor='white', edgecolor='none')
             print(f"궤적 그래프 저장됨: {filepath}")
         
@@ -294,7 +425,8 @@ class TrajectoryPlanner:
     def plot_3d_trajectory(self, trajectory_data, end_effector_positions, 
                           save_dir=None, filename_prefix="trajectory_3d"):
         """3D 공간에서의 End-Effector 궤적 그래프"""
-        fig = plt.figure(figsize=(12, 9))
+        fig = Figure(figsize=(12, 9))
+        FigureCanvasAgg(fig)
         
         # 3D 궤적 플롯
         ax1 = fig.add_subplot(221, projection='3d')
@@ -365,7 +497,7 @@ class TrajectoryPlanner:
         ax4.grid(True, alpha=0.3)
         ax4.legend()
         
-        plt.tight_layout()
+        fig.tight_layout()
         
         # 파일 저장
         if save_dir:
@@ -374,7 +506,7 @@ class TrajectoryPlanner:
             filename = f"{filename_prefix}_{timestamp}.png"
             filepath = os.path.join(save_dir, filename)
             
-            plt.savefig(filepath, dpi=300, bbox_inches='tight',
+            fig.savefig(filepath, dpi=300, bbox_inches='tight',
                        facecolor='white', edgecolor='none')
             print(f"3D 궤적 그래프 저장됨: {filepath}")
         
@@ -387,81 +519,76 @@ class TrajectoryPlanner:
         velocities = trajectory_data['velocities']
         n_joints = trajectory_data['n_joints']
         
+        # 관절 축(axis=0)에 대한 일괄 축약으로 관절별 통계 계산
+        rms_jerk = np.sqrt(np.einsum('ij,ij->j', jerks, jerks) / len(jerks))
+        max_velocity = np.abs(velocities).max(axis=0)
+        max_acceleration = np.abs(accelerations).max(axis=0)
+        max_jerk = np.abs(jerks).max(axis=0)
+        smoothness_score = 1.0 / (1.0 + rms_jerk)
+        
         analysis = {
-            'joint_analysis': [],
+            'joint_analysis': [
+                {
+                    'joint': joint_idx + 1,
+                    'rms_jerk': rms_jerk[joint_idx],
+                    'max_velocity': max_velocity[joint_idx],
+                    'max_acceleration': max_acceleration[joint_idx],
+                    'max_jerk': max_jerk[joint_idx],
+                    'smoothness_score': smoothness_score[joint_idx]
+                }
+                for joint_idx in range(n_joints)
+            ],
             'overall_smoothness': 0.0
         }
-        
-        total_jerk_rms = 0.0
-        
-        for joint_idx in range(n_joints):
-            joint_jerks = jerks[:, joint_idx]
-            joint_accels = accelerations[:, joint_idx]
-            joint_vels = velocities[:, joint_idx]
-            
-            # RMS 저크
-            rms_jerk = np.sqrt(np.mean(joint_jerks**2))
-            
-            # 최대 절대값들
-            max_velocity = np.max(np.abs(joint_vels))
-            max_acceleration = np.max(np.abs(joint_accels))
-            max_jerk = np.max(np.abs(joint_jerks))
-            
-            joint_analysis = {
-                'joint': joint_idx + 1,
-                'rms_jerk': rms_jerk,
-                'max_velocity': max_velocity,
-                'max_acceleration': max_acceleration,
-                'max_jerk': max_jerk,
-                'smoothness_score': 1.0 / (1.0 + rms_jerk)
-            }
-            
-            analysis['joint_analysis'].append(joint_analysis)
-            total_jerk_rms += rms_jerk
+        total_jerk_rms = rms_jerk.sum()
         
         # 전체 부드러움 점수
         analysis['overall_smoothness'] = 1.0 / (1.0 + total_jerk_rms / n_joints)
         
         return analysis
     
-    def save_trajectory_data(self, trajectory_data, file_path, format='csv'):
-        """궤적 데이터를 파일로 저장"""
-        time = trajectory_data['time']
-        positions = trajectory_data['positions']
-        velocities = trajectory_data['velocities']
-        accelerations = trajectory_data['accelerations']
-        jerks = trajectory_data['jerks']
+    @staticmethod
+    def _infer_data_format(file_path, format):
+        """format이 None이면 확장자(.csv/.npz/.txt)로 결정 (그 외 확장자는 기존 기본값 'csv')"""
+        if format is not None:
+            return format.lower()
+        ext = os.path.splitext(file_path)[1].lower().lstrip('.')
+        return ext if ext in ('csv', 'npz', 'txt') else 'csv'
+    
+    def save_trajectory_data(self, trajectory_data, file_path, format=None, dtype=None):
+        """궤적 데이터를 파일로 저장 (format 생략 시 확장자로 결정, dtype=np.float32 지정 시 축소 저장)"""
+        format = self._infer_data_format(file_path, format)
+        time = np.asarray(trajectory_data['time'], dtype=dtype)
+        positions = np.asarray(trajectory_data['positions'], dtype=dtype)
+        velocities = np.asarray(trajectory_data['velocities'], dtype=dtype)
+        accelerations = np.asarray(trajectory_data['accelerations'], dtype=dtype)
+        jerks = np.asarray(trajectory_data['jerks'], dtype=dtype)
         n_joints = trajectory_data['n_joints']
         
-        if format.lower() == 'csv':
-            import csv
+        # 관절별로 [위치, 속도, 가속도, 저크] 열이 번갈아 오도록 한 번에 배치
+        data = np.column_stack([
+            time,
+            np.stack([positions, velocities, accelerations, jerks], axis=2).reshape(len(time), -1)
+        ])
+        
+        if format == 'csv':
+            header = ['Time(s)']
+            for i in range(n_joints):
+                header.extend([f'Joint{i+1}_Pos(rad)', f'Joint{i+1}_Vel(rad/s)', 
+                             f'Joint{i+1}_Acc(rad/s2)', f'Joint{i+1}_Jerk(rad/s3)'])
             
-            with open(file_path, 'w', newline='', encoding='utf-8') as csvfile:
-                writer = csv.writer(csvfile)
-                
-                # 헤더 작성
-                header = ['Time(s)']
-                for i in range(n_joints):
-                    header.extend([f'Joint{i+1}_Pos(rad)', f'Joint{i+1}_Vel(rad/s)', 
-                                 f'Joint{i+1}_Acc(rad/s2)', f'Joint{i+1}_Jerk(rad/s3)'])
-                writer.writerow(header)
-                
-                # 데이터 작성
-                for i, t in enumerate(time):
-                    row = [t]
-                    for j in range(n_joints):
-                        row.extend([positions[i, j], velocities[i, j], 
-                                  accelerations[i, j], jerks[i, j]])
-                    writer.writerow(row)
+            with open(file_path, 'w', newline='', encoding='utf-8', buffering=1 << 20) as csvfile:
+                np.savetxt(csvfile, data, fmt='%s', delimiter=',', newline='\r\n',
+                           header=','.join(header), comments='')
                     
-        elif format.lower() == 'npz':
-            np.savez(file_path, 
-                    time=time, positions=positions, velocities=velocities,
-                    accelerations=accelerations, jerks=jerks,
-                    n_joints=n_joints)
+        elif format == 'npz':
+            np.savez_compressed(file_path, 
+                               time=time, positions=positions, velocities=velocities,
+                               accelerations=accelerations, jerks=jerks,
+                               n_joints=n_joints)
                     
-        elif format.lower() == 'txt':
-            with open(file_path, 'w', encoding='utf-8') as txtfile:
+        elif format == 'txt':
+            with open(file_path, 'w', encoding='utf-8', buffering=1 << 20) as txtfile:
                 txtfile.write(f"Trajectory Data - {n_joints} DOF Robot\n")
                 txtfile.write(f"Duration: {trajectory_data.get('duration', 'Unknown')} seconds\n")
                 txtfile.write(f"Time steps: {len(time)}\n\n")
@@ -472,18 +599,15 @@ class TrajectoryPlanner:
                                 f"Joint{i+1}_Acc(rad/s2)\tJoint{i+1}_Jerk(rad/s3)\t")
                 txtfile.write("\n")
                 
-                for i, t in enumerate(time):
-                    txtfile.write(f"{t:.6f}\t")
-                    for j in range(n_joints):
-                        txtfile.write(f"{positions[i, j]:.6f}\t{velocities[i, j]:.6f}\t"
-                                    f"{accelerations[i, j]:.6f}\t{jerks[i, j]:.6f}\t")
-                    txtfile.write("\n")
+                # 각 행의 끝에도 탭을 남기는 기존 형식 유지
+                np.savetxt(txtfile, data, fmt='%.6f', delimiter='\t', newline='\t\n')
         
         print(f"궤적 데이터 저장됨: {file_path}")
     
-    def load_trajectory_data(self, file_path, format='csv'):
-        """파일에서 궤적 데이터 로드"""
-        if format.lower() == 'npz':
+    def load_trajectory_data(self, file_path, format=None):
+        """파일에서 궤적 데이터 로드 (format 생략 시 확장자로 결정)"""
+        format = self._infer_data_format(file_path, format)
+        if format == 'npz':
             data = np.load(file_path)
             return {
                 'time': data['time'],
@@ -493,5 +617,18 @@ class TrajectoryPlanner:
                 'jerks': data['jerks'],
                 'n_joints': int(data['n_joints'])
             }
+        elif format == 'csv':
+            data = np.loadtxt(file_path, delimiter=',', skiprows=1, ndmin=2)
+            
+            # 관절별로 [위치, 속도, 가속도, 저크] 순서로 저장된 열을 분리
+            joint_data = data[:, 1:].reshape(len(data), -1, 4)
+            return {
+                'time': data[:, 0],
+                'positions': joint_data[:, :, 0],
+                'velocities': joint_data[:, :, 1],
+                'accelerations': joint_data[:, :, 2],
+                'jerks': joint_data[:, :, 3],
+                'n_joints': joint_data.shape[1]
+            }
         else:
             raise NotImplementedError(f"Loading format '{format}' not implemented yet")
\ No newline at end of file
@@ -11,12 +11,95 @@ utils.py - MovingSimulation/utils.py
 
 import numpy as np
 import csv
+import io
+import logging
+import logging.handlers
+import math
 import os
 import time
+import threading
 from datetime import datetime
 from functools import wraps
+from collections import defaultdict
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+def _wrap_angle_scalar(angle, min_angle, max_angle):
+    """스칼라 각도를 [min_angle, max_angle] 범위로 감싸기 (범위 위쪽에서 내려온 값은 max_angle)"""
+    normalized = min_angle + (angle - min_angle) % (max_angle - min_angle)
+    if normalized == min_angle and angle > min_angle:
+        return max_angle
+    return normalized
+
+
+def _rmat_to_euler_xyz(R):
+    """회전 행렬 → 'xyz' 오일러 각 (math 스칼라 연산, R[i][j] 접근은 리스트/배열 모두 지원)"""
+    sy = math.sqrt(R[0][0] * R[0][0] + R[1][0] * R[1][0])
+    if sy >= 1e-6:
+        return math.atan2(R[2][1], R[2][2]), math.atan2(-R[2][0], sy), math.atan2(R[1][0], R[0][0])
+    return math.atan2(-R[1][2], R[1][1]), math.atan2(-R[2][0], sy), 0.0
+
+
+if NUMBA_AVAILABLE:
+    # 시그니처 없이 첫 호출 때 입력 타입별로 컴파일 (import 시간에 컴파일 비용을 물리지 않고,
+    #  읽기 전용 배열 등도 그대로 받음)
+    # (cache=True는 쓰지 않음: 디스크 캐시가 처음 컴파일한 모듈 이름에 묶여
+    #  'utils' / 'MovingSimulation.utils' 중 다른 이름으로 import하면 실패함)
+    _rmat_to_euler_xyz_jit = njit(fastmath=True)(_rmat_to_euler_xyz)
+    
+    @njit(parallel=True)
+    def _wrap_angles_kernel(angles, min_angle, max_angle):
+        """각도 배열 감싸기 커널 (샘플 단위 병렬화, _wrap_angle_scalar와 같은 규칙)"""
+        span = max_angle - min_angle
+        out = np.empty_like(angles)
+        for i in prange(angles.shape[0]):
+            normalized = min_angle + (angles[i] - min_angle) % span
+            if normalized == min_angle and angles[i] > min_angle:
+                normalized = max_angle
+            out[i] = normalized
+        return out
+    
+    @njit(parallel=True)
+    def _interpolate_angles_kernel(angle1, angle2, t):
+        """최단 경로 각도 보간 커널 (샘플 단위 병렬화, 분기 없는 2π 감싸기)"""
+        two_pi = 2.0 * np.pi
+        inv_two_pi = 1.0 / two_pi
+        out = np.empty_like(angle1)
+        for i in prange(angle1.shape[0]):
+            diff = angle2[i] - angle1[i]
+            diff -= two_pi * np.rint(diff * inv_two_pi)
+            result = angle1[i] + t[i] * diff
+            out[i] = result - two_pi * np.rint(result * inv_two_pi)
+        return out
+    
+    @njit(parallel=True, fastmath=True)
+    def _euler_xyz_kernel(rolls, pitches, yaws, out):
+        """'xyz' 순서(Rz·Ry·Rx) 회전 행렬 N개를 채우는 커널 (프레임 단위 병렬화)"""
+        for i in prange(rolls.shape[0]):
+            cr, sr = math.cos(rolls[i]), math.sin(rolls[i])
+            cp, sp = math.cos(pitches[i]), math.sin(pitches[i])
+            cy, sy = math.cos(yaws[i]), math.sin(yaws[i])
+            out[i, 0, 0] = cy*cp
+            out[i, 0, 1] = cy*sp*sr - sy*cr
+            out[i, 0, 2] = cy*sp*cr + sy*sr
+            out[i, 1, 0] = sy*cp
+            out[i, 1, 1] = sy*sp*sr + cy*cr
+            out[i, 1, 2] = sy*sp*cr - cy*sr
+            out[i, 2, 0] = -sp
+            out[i, 2, 1] = cp*sr
+            out[i, 2, 2] = cp*cr
+
 
 class Utils:
+    # 2π 감싸기용 상수
+    TWO_PI = 2.0 * np.pi
+    INV_TWO_PI = 1.0 / (2.0 * np.pi)
+    
     def __init__(self):
         """유틸리티 클래스 초기화"""
         # 각도 변환 상수
@@ -26,74 +109,169 @@ class Utils:
         # 기본 허용 오차
         self.DEFAULT_TOLERANCE = 1e-6
         
+        # [0, π/2] 구간 sin 조회 테이블 (fast=True 회전 행렬용, 최대 오차 약 8e-4)
+        self.SIN_LUT_SIZE = 1024
+        self._sin_lut = np.sin(np.linspace(0, np.pi / 2, self.SIN_LUT_SIZE))
+        self._lut_scale = (self.SIN_LUT_SIZE - 1) / (np.pi / 2)
+        
+        # validate_joint_angles용 관절 제한 배열 캐시 (joint_limits, 복사본, n_joints, mins, maxs)
+        self._limits_cache = None
+        
         # 로그 설정
         self.enable_logging = True
         self.log_file = None
         
+        # 파일 로그는 logging 핸들러로 한 번만 열어 두고 버퍼링
+        # (MemoryHandler: N개마다 또는 WARNING 이상에서 FileHandler로 flush)
+        # 전역 로거 레지스트리에 남지 않도록 인스턴스 전용 Logger를 직접 생성
+        self.LOG_FLUSH_INTERVAL = 100
+        self._logger = logging.Logger('MovingSim')
+        self._log_handler = None
+        self._log_fh_path = None
+        self._log_lock = threading.Lock()
+        
+        # measure_execution_time(aggregate=True)로 수집한 함수별 실행 시간 [ns]
+        self._timing_stats = defaultdict(list)
+        
+        # 로그 타임스탬프 문자열은 초가 바뀔 때만 다시 포맷
+        self._ts_sec = -1
+        self._ts_str = ''
+        
     def deg_to_rad(self, degrees):
-        """도에서 라디안으로 변환"""
-        if isinstance(degrees, (list, tuple, np.ndarray)):
-            return [d * self.DEG2RAD for d in degrees]
-        else:
+        """도에서 라디안으로 변환 (스칼라는 스칼라, 시퀀스는 ndarray로 반환)"""
+        arr = np.asarray(degrees)
+        if arr.ndim == 0:
             return degrees * self.DEG2RAD
+        return arr * self.DEG2RAD
     
     def rad_to_deg(self, radians):
-        """라디안에서 도로 변환"""
-        if isinstance(radians, (list, tuple, np.ndarray)):
-            return [r * self.RAD2DEG for r in radians]
-        else:
+        """라디안에서 도로 변환 (스칼라는 스칼라, 시퀀스는 ndarray로 반환)"""
+        arr = np.asarray(radians)
+        if arr.ndim == 0:
             return radians * self.RAD2DEG
+        return arr * self.RAD2DEG
+    
+    def _wrap_angle(self, angle, min_angle, max_angle):
+        """나머지 연산으로 각도를 [min_angle, max_angle] 범위로 감싸기 (반복문 없음)
+        
+        범위 위쪽에서 내려온 값은 max_angle, 아래쪽에서 올라온 값은 min_angle로
+        끝나도록 경계값을 처리한다.
+        """
+        if isinstance(angle, (int, float)):
+            return _wrap_angle_scalar(angle, min_angle, max_angle)
+        
+        if NUMBA_AVAILABLE:
+            angles = np.asarray(angle, dtype=np.float64)
+            normalized = _wrap_angles_kernel(np.ascontiguousarray(angles).ravel(),
+                                             float(min_angle), float(max_angle))
+            return normalized.reshape(angles.shape)[()]
+        
+        normalized = min_angle + np.remainder(angle - min_angle, max_angle - min_angle)
+        normalized = np.where((normalized == min_angle) & (angle > min_angle), max_angle, normalized)
+        return normalized[()]
     
     def normalize_angle(self, angle, angle_range=(-np.pi, np.pi)):
         """각도를 지정된 범위로 정규화"""
         min_angle, max_angle = angle_range
-        range_size = max_angle - min_angle
-        
-        normalized = angle
-        while normalized > max_angle:
-            normalized -= range_size
-        while normalized < min_angle:
-            normalized += range_size
-            
-        return normalized
+        return self._wrap_angle(angle, min_angle, max_angle)
+    
+    def normalize_angles(self, angles_array, angle_range=(-np.pi, np.pi)):
+        """각도 배열 전체를 지정된 범위로 한 번에 정규화"""
+        min_angle, max_angle = angle_range
+        return self._wrap_angle(np.asarray(angles_array, dtype=float), min_angle, max_angle)
     
     def normalize_angle_degrees(self, angle, angle_range=(-180, 180)):
         """각도를 지정된 범위로 정규화 (도 단위)"""
         min_angle, max_angle = angle_range
-        range_size = max_angle - min_angle
+        return self._wrap_angle(angle, min_angle, max_angle)
+    
+    def _fast_sincos(self, theta):
+        """조회 테이블을 이용한 근사 sin/cos 계산
+        
+        각도를 [-π, π]로 감싼 뒤 |θ| > π/2 이면 π - |θ|로 접어 cos 부호를 뒤집고,
+        [0, π/2]의 sin 테이블에서 가장 가까운 값을 찾는다. cos는 피타고라스 항등식으로 복원한다.
         
-        normalized = angle
-        while normalized > max_angle:
-            normalized -= range_size
-        while normalized < min_angle:
-            normalized += range_size
+        Args:
+            theta: 각도 [rad] (스칼라 또는 배열)
             
-        return normalized
+        Returns:
+            tuple: (sin, cos) 근사값
+        """
+        theta = self._wrap_angle(theta, -np.pi, np.pi)
+        abs_theta = np.abs(theta)
+        negate_cos = abs_theta > np.pi / 2
+        reduced = np.where(negate_cos, np.pi - abs_theta, abs_theta)
+        
+        s = self._sin_lut[np.rint(reduced * self._lut_scale).astype(np.intp)]
+        c = np.sqrt(1.0 - s * s)
+        return np.copysign(s, theta)[()], np.where(negate_cos, -c, c)[()]
     
-    def rotation_matrix_x(self, angle):
-        """X축 회전 행렬 생성"""
-        c = np.cos(angle)
-        s = np.sin(angle)
+    def rotation_matrix_x(self, angle, fast=False, out=None):
+        """X축 회전 행렬 생성 (fast=True이면 sin/cos 조회 테이블 근사 사용)
+        
+        out에 3x3 float 배열을 넘기면 새로 할당하지 않고 각도에 따라 바뀌는 4개 원소만
+        덮어써서 반환한다. 상수 원소(0, 1)는 호출하는 쪽에서 처음 한 번 채워 두어야 한다
+        (예: out = self.rotation_matrix_x(0.0)).
+        """
+        if fast:
+            s, c = self._fast_sincos(angle)
+        else:
+            c = np.cos(angle)
+            s = np.sin(angle)
+        if out is not None:
+            out[1, 1] = c
+            out[1, 2] = -s
+            out[2, 1] = s
+            out[2, 2] = c
+            return out
         return np.array([
             [1, 0, 0],
             [0, c, -s],
             [0, s, c]
         ])
     
-    def rotation_matrix_y(self, angle):
-        """Y축 회전 행렬 생성"""
-        c = np.cos(angle)
-        s = np.sin(angle)
+    def rotation_matrix_y(self, angle, fast=False, out=None):
+        """Y축 회전 행렬 생성 (fast=True이면 sin/cos 조회 테이블 근사 사용)
+        
+        out에 3x3 float 배열을 넘기면 새로 할당하지 않고 각도에 따라 바뀌는 4개 원소만
+        덮어써서 반환한다. 상수 원소(0, 1)는 호출하는 쪽에서 처음 한 번 채워 두어야 한다
+        (예: out = self.rotation_matrix_y(0.0)).
+        """
+        if fast:
+            s, c = self._fast_sincos(angle)
+        else:
+            c = np.cos(angle)
+            s = np.sin(angle)
+        if out is not None:
+            out[0, 0] = c
+            out[0, 2] = s
+            out[2, 0] = -s
+            out[2, 2] = c
+            return out
         return np.array([
             [c, 0, s],
             [0, 1, 0],
             [-s, 0, c]
         ])
     
-    def rotation_matrix_z(self, angle):
-        """Z축 회전 행렬 생성"""
-        c = np.cos(angle)
-        s = np.sin(angle)
+    def rotation_matrix_z(self, angle, fast=False, out=None):
+        """Z축 회전 행렬 생성 (fast=True이면 sin/cos 조회 테이블 근사 사용)
+        
+        out에 3x3 float 배열을 넘기면 새로 할당하지 않고 각도에 따라 바뀌는 4개 원소만
+        덮어써서 반환한다. 상수 원소(0, 1)는 호출하는 쪽에서 처음 한 번 채워 두어야 한다
+        (예: out = self.rotation_matrix_z(0.0)).
+        """
+        if fast:
+            s, c = self._fast_sincos(angle)
+        else:
+            c = np.cos(angle)
+            s = np.sin(angle)
+        if out is not None:
+            out[0, 0] = c
+            out[0, 1] = -s
+            out[1, 0] = s
+            out[1, 1] = c
+            return out
         return np.array([
             [c, -s, 0],
             [s, c, 0],
@@ -101,54 +279,196 @@ class Utils:
         ])
     
     def euler_to_rotation_matrix(self, roll, pitch, yaw, order='xyz'):
-        """오일러 각을 회전 행렬로 변환"""
-        Rx = self.rotation_matrix_x(roll)
-        Ry = self.rotation_matrix_y(pitch)
-        Rz = self.rotation_matrix_z(yaw)
+        """오일러 각을 회전 행렬로 변환 (행렬 곱 없이 폐형식으로 직접 계산)"""
+        c = np.cos([roll, pitch, yaw])
+        s = np.sin([roll, pitch, yaw])
+        return np.array(self._euler_rotation_entries(c, s, order))
+    
+    def euler_to_rotation_matrix_batch(self, rpy, order='xyz'):
+        """여러 오일러 각을 한 번에 회전 행렬로 변환
+        
+        Args:
+            rpy (array_like): (..., 3) [roll, pitch, yaw] 배열 [rad]
+            order (str): 회전 순서 ('xyz', 'zyx', 'zxy')
+            
+        Returns:
+            numpy.ndarray: (..., 3, 3) 회전 행렬 배열
+        """
+        rpy = np.asarray(rpy, dtype=float)
+        entries = self._euler_rotation_entries(np.cos(rpy), np.sin(rpy), order)
+        
+        R = np.empty(rpy.shape[:-1] + (3, 3))
+        for i in range(3):
+            for j in range(3):
+                R[..., i, j] = entries[i][j]
+        return R
+    
+    def euler_to_rotation_matrices(self, rolls, pitches, yaws):
+        """roll/pitch/yaw 1차원 배열로부터 'xyz' 순서 회전 행렬 N개를 생성
+        
+        Numba가 설치되어 있으면 프레임 단위로 병렬화된 커널을 사용하고,
+        없으면 euler_to_rotation_matrix_batch로 계산한다.
+        
+        Args:
+            rolls, pitches, yaws (array_like): (N,) 각도 배열 [rad]
+            
+        Returns:
+            numpy.ndarray: (N, 3, 3) 회전 행렬 배열
+        """
+        rolls, pitches, yaws = np.broadcast_arrays(
+            *(np.asarray(a, dtype=np.float64).ravel() for a in (rolls, pitches, yaws)))
+        
+        if not NUMBA_AVAILABLE:
+            return self.euler_to_rotation_matrix_batch(np.stack([rolls, pitches, yaws], axis=-1))
+        
+        out = np.empty((rolls.shape[0], 3, 3))
+        _euler_xyz_kernel(np.ascontiguousarray(rolls), np.ascontiguousarray(pitches),
+                          np.ascontiguousarray(yaws), out)
+        return out
+    
+    def _euler_rotation_entries(self, c, s, order):
+        """오일러 각 회전 행렬의 폐형식 원소 계산
+        
+        Args:
+            c, s: [roll, pitch, yaw]의 cos/sin 값 (마지막 축 길이 3)
+            order (str): 'xyz' (Rz·Ry·Rx), 'zyx' (Rx·Ry·Rz), 'zxy' (Ry·Rx·Rz)
+            
+        Returns:
+            list: 3x3 원소의 중첩 리스트 (각 원소는 c, s의 앞쪽 축 형상을 따름)
+        """
+        cr, cp, cy = c[..., 0], c[..., 1], c[..., 2]
+        sr, sp, sy = s[..., 0], s[..., 1], s[..., 2]
         
         if order.lower() == 'xyz':
-            return Rz @ Ry @ Rx
+            return [[cy*cp, cy*sp*sr - sy*cr, cy*sp*cr + sy*sr],
+                    [sy*cp, sy*sp*sr + cy*cr, sy*sp*cr - cy*sr],
+                    [-sp, cp*sr, cp*cr]]
         elif order.lower() == 'zyx':
-            return Rx @ Ry @ Rz
+            return [[cp*cy, -cp*sy, sp],
+                    [cr*sy + sr*sp*cy, cr*cy - sr*sp*sy, -sr*cp],
+                    [sr*sy - cr*sp*cy, sr*cy + cr*sp*sy, cr*cp]]
         elif order.lower() == 'zxy':
-            return Ry @ Rx @ Rz
+            return [[cp*cy + sp*sr*sy, sp*sr*cy - cp*sy, sp*cr],
+                    [cr*sy, cr*cy, -sr],
+                    [cp*sr*sy - sp*cy, sp*sy + cp*sr*cy, cp*cr]]
         else:
             raise ValueError(f"Unsupported rotation order: {order}")
     
     def rotation_matrix_to_euler(self, R, order='xyz'):
         """회전 행렬을 오일러 각으로 변환"""
         if order.lower() == 'xyz':
-            sy = np.sqrt(R[0, 0]**2 + R[1, 0]**2)
-            singular = sy < 1e-6
-            
-            if not singular:
-                roll = np.arctan2(R[2, 1], R[2, 2])
-                pitch = np.arctan2(-R[2, 0], sy)
-                yaw = np.arctan2(R[1, 0], R[0, 0])
-            else:
-                roll = np.arctan2(-R[1, 2], R[1, 1])
-                pitch = np.arctan2(-R[2, 0], sy)
-                yaw = 0
-                
-            return roll, pitch, yaw
+            if NUMBA_AVAILABLE:
+                return _rmat_to_euler_xyz_jit(np.asarray(R, dtype=np.float64))
+            return _rmat_to_euler_xyz(np.asarray(R, dtype=float).tolist())
         else:
             raise ValueError(f"Unsupported rotation order: {order}")
     
+    def rotation_matrix_to_euler_batch(self, R, order='xyz'):
+        """여러 회전 행렬을 한 번에 오일러 각으로 변환 (특이점은 np.where로 분기 없이 처리)
+        
+        Args:
+            R (array_like): (..., 3, 3) 회전 행렬 배열
+            order (str): 회전 순서 (현재 'xyz'만 지원)
+            
+        Returns:
+            numpy.ndarray: (..., 3) [roll, pitch, yaw] 배열 [rad]
+        """
+        if order.lower() != 'xyz':
+            raise ValueError(f"Unsupported rotation order: {order}")
+        
+        R = np.asarray(R, dtype=float)
+        sy = np.hypot(R[..., 0, 0], R[..., 1, 0])
+        singular = sy < 1e-6
+        
+        roll = np.where(singular,
+                        np.arctan2(-R[..., 1, 2], R[..., 1, 1]),
+                        np.arctan2(R[..., 2, 1], R[..., 2, 2]))
+        pitch = np.arctan2(-R[..., 2, 0], sy)
+        yaw = np.where(singular, 0.0, np.arctan2(R[..., 1, 0], R[..., 0, 0]))
+        
+        return np.stack([roll, pitch, yaw], axis=-1)
+    
+    def axis_angle_from_matrix(self, R):
+        """회전 행렬 → 축-각 표현 (R - R^T의 반대칭 성분을 이용한 닫힌 형식)
+        
+        Args:
+            R (array_like): 3x3 회전 행렬
+        
+        Returns:
+            tuple: (axis, angle) - 단위 회전축 (3,) ndarray, 회전각 [rad] (0 ≤ angle ≤ π)
+                   회전이 거의 없으면 축은 [0, 0, 1]로 반환
+        """
+        R = np.asarray(R, dtype=float)
+        r00, r01, r02 = float(R[0, 0]), float(R[0, 1]), float(R[0, 2])
+        r10, r11, r12 = float(R[1, 0]), float(R[1, 1]), float(R[1, 2])
+        r20, r21, r22 = float(R[2, 0]), float(R[2, 1]), float(R[2, 2])
+        
+        # 반대칭 성분 (a, b, c) = 2·sinθ·axis, cosθ = (tr(R) - 1) / 2
+        a = r21 - r12
+        b = r02 - r20
+        c = r10 - r01
+        d = math.sqrt(a * a + b * b + c * c)
+        cos_theta = 0.5 * (r00 + r11 + r22 - 1.0)
+        angle = math.atan2(0.5 * d, cos_theta)
+        
+        if d > 1e-6:
+            return np.array([a / d, b / d, c / d]), angle
+        
+        if cos_theta > 0.0:
+            # θ ≈ 0: 축이 정의되지 않음
+            return np.array([0.0, 0.0, 1.0]), angle
+        
+        # θ ≈ π: R ≈ 2·u·u^T - I 이므로 대각 성분이 가장 큰 축에서 u를 복원
+        diag = (r00, r11, r22)
+        k = max(range(3), key=diag.__getitem__)
+        u_k = math.sqrt(max(0.0, 0.5 * (diag[k] + 1.0)))
+        sym = (R + R.T) * (0.25 / u_k)
+        axis = sym[k].copy()
+        axis[k] = u_k
+        axis /= np.linalg.norm(axis)
+        # 반대칭 성분이 남아 있으면 그 방향으로 부호를 맞춤
+        if axis[0] * a + axis[1] * b + axis[2] * c < 0.0:
+            axis = -axis
+        return axis, angle
+    
     def homogeneous_transform(self, rotation_matrix, translation_vector):
         """회전 행렬과 평행이동 벡터로 동차 변환 행렬 생성"""
-        T = np.eye(4)
+        T = np.empty((4, 4))
         T[:3, :3] = rotation_matrix
         T[:3, 3] = translation_vector
+        T[3, :3] = 0.0
+        T[3, 3] = 1.0
         return T
     
     def inverse_homogeneous_transform(self, T):
         """동차 변환 행렬의 역변환"""
-        R = T[:3, :3]
-        t = T[:3, 3]
+        Rt = T[:3, :3].T
         
-        T_inv = np.eye(4)
-        T_inv[:3, :3] = R.T
-        T_inv[:3, 3] = -R.T @ t
+        T_inv = np.empty((4, 4))
+        T_inv[:3, :3] = Rt
+        T_inv[:3, 3] = -Rt @ T[:3, 3]
+        T_inv[3, :3] = 0.0
+        T_inv[3, 3] = 1.0
+        
+        return T_inv
+    
+    def inverse_homogeneous_transform_batch(self, T):
+        """여러 동차 변환 행렬의 역변환을 한 번에 계산
+        
+        Args:
+            T (array_like): (..., 4, 4) 동차 변환 행렬 배열
+            
+        Returns:
+            numpy.ndarray: (..., 4, 4) 역변환 행렬 배열
+        """
+        T = np.asarray(T, dtype=float)
+        Rt = np.swapaxes(T[..., :3, :3], -1, -2)
+        
+        T_inv = np.empty(T.shape)
+        T_inv[..., :3, :3] = Rt
+        T_inv[..., :3, 3] = -np.einsum('...ij,...j->...i', Rt, T[..., :3, 3])
+        T_inv[..., 3, :3] = 0.0
+        T_inv[..., 3, 3] = 1.0
         
         return T_inv
     
@@ -157,74 +477,107 @@ class Utils:
         if tolerance is None:
             tolerance = self.DEFAULT_TOLERANCE
         
-        # 직교성 검사: R * R^T = I
-        should_be_identity = R @ R.T
-        identity = np.eye(3)
+        R = np.asarray(R, dtype=float)
         
-        if not np.allclose(should_be_identity, identity, atol=tolerance):
+        # 직교성 검사: R * R^T = I 의 원소를 직접 계산
+        # (np.allclose와 같이 대각 원소에는 상대 오차 1e-5를 더해 허용)
+        row_norms = np.einsum('ij,ij->i', R, R)
+        if np.any(np.abs(row_norms - 1.0) > tolerance + 1e-5):
+            return False
+        
+        cross_dots = np.einsum('ij,ij->i', R, R[[1, 2, 0]])
+        if np.any(np.abs(cross_dots) > tolerance):
             return False
         
         # 행렬식 검사: det(R) = 1
-        det = np.linalg.det(R)
-        if not np.isclose(det, 1.0, atol=tolerance):
+        det = self._det3(R)
+        if abs(det - 1.0) > tolerance + 1e-5:
             return False
         
         return True
     
+    @staticmethod
+    def _det3(M):
+        """3x3 행렬식을 여인수 전개로 직접 계산 (LAPACK 호출 없음)"""
+        (a, b, c), (d, e, f), (g, h, i) = np.asarray(M, dtype=float).tolist()
+        return a * (e * i - f * h) - b * (d * i - f * g) + c * (d * h - e * g)
+    
     def interpolate_angles(self, angle1, angle2, t):
-        """두 각도 사이의 선형 보간 (최단 경로)"""
+        """두 각도 사이의 선형 보간 (최단 경로)
+        
+        2π의 정수배를 반올림으로 빼서 [-π, π]로 감싸므로 비교 분기가 없다.
+        """
+        if all(isinstance(x, (int, float)) for x in (angle1, angle2, t)):
+            diff = angle2 - angle1
+            diff -= self.TWO_PI * round(diff * self.INV_TWO_PI)
+            result = angle1 + t * diff
+            return result - self.TWO_PI * round(result * self.INV_TWO_PI)
+        
+        return self.interpolate_angles_batch(angle1, angle2, t)[()]
+    
+    def interpolate_angles_batch(self, angle1, angle2, t):
+        """각도 배열 사이의 최단 경로 선형 보간 (브로드캐스트 지원)
+        
+        Args:
+            angle1, angle2 (array_like): 시작/끝 각도 [rad]
+            t (array_like): 보간 비율 (0~1)
+            
+        Returns:
+            numpy.ndarray: 브로드캐스트된 형상의 [-π, π] 범위 보간 각도
+        """
+        a1, a2, tt = np.broadcast_arrays(*(np.asarray(x, dtype=np.float64) for x in (angle1, angle2, t)))
+        
+        if NUMBA_AVAILABLE:
+            # 컴파일된 커널로 한 번에 보간
+            result = _interpolate_angles_kernel(np.ascontiguousarray(a1).ravel(),
+                                                np.ascontiguousarray(a2).ravel(),
+                                                np.ascontiguousarray(tt).ravel())
+            return result.reshape(a1.shape)
+        
         # 각도 차이 계산 (최단 경로)
-        diff = self.normalize_angle(angle2 - angle1)
+        diff = a2 - a1
+        diff -= self.TWO_PI * np.rint(diff * self.INV_TWO_PI)
         
         # 선형 보간
-        result = angle1 + t * diff
+        result = a1 + tt * diff
         
-        return self.normalize_angle(result)
+        return result - self.TWO_PI * np.rint(result * self.INV_TWO_PI)
     
     def save_results_to_csv(self, data, file_path):
         """시뮬레이션 결과를 CSV 파일로 저장"""
         try:
-            os.makedirs(os.path.dirname(file_path), exist_ok=True)
+            # 디렉터리가 이미 있으면 makedirs 호출 생략 (경로 없는 파일명도 허용)
+            dir_name = os.path.dirname(file_path)
+            if dir_name and not os.path.isdir(dir_name):
+                os.makedirs(dir_name, exist_ok=True)
             
-            with open(file_path, 'w', newline='', encoding='utf-8') as csvfile:
-                writer = csv.writer(csvfile)
-                
-                # 메타데이터 작성
-                writer.writerow(['Robot Simulation Results'])
-                writer.writerow(['Generated on', datetime.now().strftime('%Y-%m-%d %H:%M:%S')])
-                writer.writerow(['DOF', data.get('DOF', 'Unknown')])
-                writer.writerow(['Robot Type', data.get('Robot_Mode', 'Unknown')])
-                writer.writerow([])
-                
+            # 메타데이터
+            rows = [
+                ['Robot Simulation Results'],
+                ['Generated on', datetime.now().strftime('%Y-%m-%d %H:%M:%S')],
+                ['DOF', data.get('DOF', 'Unknown')],
+                ['Robot Type', data.get('Robot_Mode', 'Unknown')],
+                [],
                 # DH 파라미터 섹션
-                writer.writerow(['DH Parameters'])
-                writer.writerow(['Link', 'a (cm)', 'alpha (deg)', 'd (cm)', 'theta (deg)'])
-                
-                if 'DH_Parameters' in data:
-                    for i, params in enumerate(data['DH_Parameters']):
-                        writer.writerow([f'Link {i+1}'] + params)
-                
-                writer.writerow([])
-                
-                # 관절 각도 섹션
-                writer.writerow(['Joint Angles'])
-                writer.writerow(['Joint', 'Angle (deg)'])
-                
-                if 'Joint_Angles_deg' in data:
-                    for i, angle in enumerate(data['Joint_Angles_deg']):
-                        writer.writerow([f'Joint {i+1}', f'{angle:.3f}'])
-                
-                writer.writerow([])
-                
-                # End-effector 위치 섹션
-                writer.writerow(['End-Effector Position'])
-                writer.writerow(['Axis', 'Position (cm)'])
-                
-                if 'End_Effector_Position_cm' in data:
-                    axes = ['X', 'Y', 'Z']
-                    for i, pos in enumerate(data['End_Effector_Position_cm']):
-                        if i < len(axes):
-                            writer.writerow([axes[i], f'{pos:.3f}'])
+                ['DH Parameters'],
+                ['Link', 'a (cm)', 'alpha (deg)', 'd (cm)', 'theta (deg)']
+            ]
+            rows.extend([f'Link {i+1}', *params] for i, params in enumerate(data.get('DH_Parameters', [])))
+            
+            # 관절 각도 섹션
+            rows.extend([[], ['Joint Angles'], ['Joint', 'Angle (deg)']])
+            # 숫자는 tolist()로 한 번에 파이썬 float로 바꾼 뒤 포맷
+            angles = np.asarray(data.get('Joint_Angles_deg', []), dtype=float).ravel().tolist()
+            rows.extend([f'Joint {i+1}', '%.3f' % angle] for i, angle in enumerate(angles))
+            
+            # End-effector 위치 섹션
+            rows.extend([[], ['End-Effector Position'], ['Axis', 'Position (cm)']])
+            position = np.asarray(data.get('End_Effector_Position_cm', []), dtype=float).ravel().tolist()
+            rows.extend([axis, '%.3f' % pos] for axis, pos in zip(['X', 'Y', 'Z'], position))
+            
+            # 모든 행을 한 번에 기록
+            with open(file_path, 'w', newline='', encoding='utf-8', buffering=1 << 20) as csvfile:
+                csv.writer(csvfile).writerows(rows)
             
             print(f"Results saved to: {file_path}")
             
@@ -256,17 +609,26 @@ class Utils:
                         break
                 
                 if dh_start > 0:
-                    dh_params = []
-                    for i in range(dh_start, len(rows)):
-                        row = rows[i]
+                    # 빈 행 전까지의 DH 블록을 모아 숫자 부분을 np.loadtxt로 한 번에 파싱
+                    block = []
+                    for row in rows[dh_start:]:
+                        if len(row) == 0:
+                            break
                         if len(row) >= 5 and 'Link' in row[0]:
+                            block.append(row)
+                    
+                    try:
+                        text = ''.join(','.join(row) + '\n' for row in block)
+                        dh_params = np.loadtxt(io.StringIO(text), delimiter=',', usecols=(1, 2, 3, 4),
+                                               ndmin=2).tolist() if block else []
+                    except ValueError:
+                        # 형식이 표준과 다르면 행 단위로 파싱 (숫자가 아닌 행에서 중단)
+                        dh_params = []
+                        for row in block:
                             try:
-                                params = [float(row[j]) for j in range(1, 5)]
-                                dh_params.append(params)
+                                dh_params.append([float(row[j]) for j in range(1, 5)])
                             except ValueError:
                                 break
-                        elif len(row) == 0:
-                            break
                     data['DH_Parameters'] = dh_params
                 
             return data
@@ -274,6 +636,51 @@ class Utils:
         except Exception as e:
             raise Exception(f"Error loading CSV file: {str(e)}")
     
+    def save_results_to_npz(self, data, file_path):
+        """시뮬레이션 결과의 숫자 데이터를 압축 바이너리(.npz)로 저장
+        
+        긴 시뮬레이션 로그는 CSV 문자열 변환 대신 열 단위 바이너리로 저장하고,
+        사람이 읽을 메타데이터가 필요하면 save_results_to_csv를 함께 사용한다.
+        """
+        try:
+            dir_name = os.path.dirname(file_path)
+            if dir_name:
+                os.makedirs(dir_name, exist_ok=True)
+            
+            arrays = {
+                'generated_on': np.array(datetime.now().strftime('%Y-%m-%d %H:%M:%S')),
+                'dof': np.array(str(data.get('DOF', 'Unknown'))),
+                'robot_type': np.array(str(data.get('Robot_Mode', 'Unknown')))
+            }
+            for key in ('DH_Parameters', 'Joint_Angles_deg', 'End_Effector_Position_cm'):
+                if key in data:
+                    arrays[key] = np.asarray(data[key], dtype=np.float64)
+            
+            np.savez_compressed(file_path, **arrays)
+            print(f"Results saved to: {file_path}")
+            
+        except Exception as e:
+            raise Exception(f"Error saving NPZ file: {str(e)}")
+    
+    def load_results_from_npz(self, file_path):
+        """save_results_to_npz로 저장한 시뮬레이션 결과 로드"""
+        try:
+            with np.load(file_path, allow_pickle=False) as npz:
+                dof = str(npz['dof'])
+                data = {
+                    'DOF': int(dof) if dof.isdigit() else dof,
+                    'Robot_Type': str(npz['robot_type'])
+                }
+                if 'DH_Parameters' in npz:
+                    data['DH_Parameters'] = npz['DH_Parameters'].tolist()
+                for key in ('Joint_Angles_deg', 'End_Effector_Position_cm'):
+                    if key in npz:
+                        data[key] = npz[key]
+            return data
+            
+        except Exception as e:
+            raise Exception(f"Error loading NPZ file: {str(e)}")
+    
     def validate_joint_angles(self, joint_angles, joint_limits=None):
         """관절 각도 유효성 검사"""
         if not isinstance(joint_angles, (list, tuple, np.ndarray)):
@@ -289,21 +696,43 @@ class Utils:
             return False, "All joint angles must be numeric values"
         
         # NaN 또는 무한대 검사
-        if np.any(np.isnan(angles_array)) or np.any(np.isinf(angles_array)):
+        if not np.isfinite(angles_array).all():
             return False, "Joint angles contain NaN or infinite values"
         
         # 관절 제한 검사
         if joint_limits:
-            for i, angle_rad in enumerate(angles_array):
-                if i in joint_limits:
-                    min_deg, max_deg = joint_limits[i]
-                    angle_deg = self.rad_to_deg(angle_rad)
-                    
-                    if angle_deg < min_deg or angle_deg > max_deg:
-                        return False, f"Joint {i+1} angle {angle_deg:.1f}° exceeds limits [{min_deg}°, {max_deg}°]"
+            mins, maxs = self._joint_limit_arrays(joint_limits, len(angles_array))
+            
+            angles_deg = angles_array * self.RAD2DEG
+            mask = (angles_deg < mins) | (angles_deg > maxs)
+            if mask.any():
+                # 위반이 있을 때만 메시지 포맷팅
+                i = int(np.argmax(mask))
+                min_deg, max_deg = joint_limits[i]
+                return False, f"Joint {i+1} angle {angles_deg[i]:.1f}° exceeds limits [{min_deg}°, {max_deg}°]"
         
         return True, "Valid joint angles"
     
+    def _joint_limit_arrays(self, joint_limits, n_joints):
+        """관절 제한 딕셔너리를 관절 인덱스 순서의 (mins, maxs) 배열로 변환 (캐시 사용)
+        
+        같은 딕셔너리가 내용 변경 없이 다시 전달되면 이전에 만든 배열을 재사용한다.
+        제한이 없는 관절은 (-inf, inf)로 둔다.
+        """
+        cache = self._limits_cache
+        if (cache is not None and cache[0] is joint_limits and cache[2] == n_joints
+                and cache[1] == joint_limits):
+            return cache[3], cache[4]
+        
+        mins = np.full(n_joints, -np.inf)
+        maxs = np.full(n_joints, np.inf)
+        for i, (min_deg, max_deg) in joint_limits.items():
+            if 0 <= i < n_joints:
+                mins[i], maxs[i] = min_deg, max_deg
+        
+        self._limits_cache = (joint_limits, dict(joint_limits), n_joints, mins, maxs)
+        return mins, maxs
+    
     def validate_dh_parameters(self, dh_params):
         """DH 파라미터 유효성 검사"""
         if not isinstance(dh_params, list):
@@ -336,35 +765,73 @@ class Utils:
         
         return True, "Valid DH parameters", warnings_list
     
-    def measure_execution_time(self, func):
-        """함수 실행 시간 측정 데코레이터"""
+    def measure_execution_time(self, func=None, aggregate=False):
+        """함수 실행 시간 측정 데코레이터 (단조 증가 ns 해상도 타이머 사용)
+        
+        aggregate=True이면 매 호출마다 출력하지 않고 실행 시간을 모아 두며,
+        get_timing_stats()로 통계를 확인할 수 있다.
+        enable_logging은 호출 시점에 확인하므로 나중에 켜도 측정된다.
+        """
+        if func is None:
+            return lambda f: self.measure_execution_time(f, aggregate=aggregate)
+        
         @wraps(func)
         def wrapper(*args, **kwargs):
-            start_time = time.time()
+            # 출력할 곳이 없으면 타이머 없이 바로 호출
+            if not aggregate and not self.enable_logging:
+                return func(*args, **kwargs)
+            start_ns = time.perf_counter_ns()
             result = func(*args, **kwargs)
-            end_time = time.time()
+            elapsed_ns = time.perf_counter_ns() - start_ns
             
-            execution_time = end_time - start_time
-            if self.enable_logging:
-                print(f"{func.__name__} execution time: {execution_time:.4f} seconds")
+            if aggregate:
+                self._timing_stats[func.__name__].append(elapsed_ns)
+            elif self.enable_logging:
+                print(f"{func.__name__} execution time: {elapsed_ns * 1e-9:.6f} seconds")
             
             return result
         return wrapper
     
+    def get_timing_stats(self):
+        """aggregate=True로 측정한 함수별 실행 시간 통계 [s]"""
+        stats = {}
+        for name, samples in self._timing_stats.items():
+            samples_s = np.asarray(samples) * 1e-9
+            stats[name] = {
+                'count': samples_s.size,
+                'total': samples_s.sum(),
+                'mean': samples_s.mean(),
+                'min': samples_s.min(),
+                'max': samples_s.max()
+            }
+        return stats
+    
     def log_message(self, message, level='INFO'):
         """로그 메시지 기록"""
         if not self.enable_logging:
             return
         
-        timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-        log_entry = f"[{timestamp}] {level}: {message}"
+        sec = int(time.time())
+        if sec != self._ts_sec:
+            self._ts_sec = sec
+            self._ts_str = datetime.fromtimestamp(sec).strftime('%Y-%m-%d %H:%M:%S')
         
-        print(log_entry)
+        print(f"[{self._ts_str}] {level}: {message}")
         
         if self.log_file:
             try:
-                with open(self.log_file, 'a', encoding='utf-8') as f:
-                    f.write(log_entry + '\n')
+                with self._log_lock:
+                    # log_file 속성이 직접 바뀐 경우에도 새 파일로 다시 연다
+                    if self._log_handler is None or self._log_fh_path != self.log_file:
+                        self._close_log_handle()
+                        self._open_log_handle(self.log_file)
+                
+                # 알 수 없는 레벨 이름은 INFO로 기록 (본문에는 원래 이름 유지)
+                level_num = logging.getLevelName(level)
+                if not isinstance(level_num, int):
+                    level_num = logging.INFO
+                # %s 인자는 핸들러가 실제로 기록할 때만 포맷
+                self._logger.log(level_num, '[%s] %s: %s', self._ts_str, level, message)
             except Exception as e:
                 print(f"Failed to write to log file: {e}")
     
@@ -372,11 +839,49 @@ class Utils:
         """로그 파일 설정"""
         try:
             os.makedirs(os.path.dirname(file_path), exist_ok=True)
+            with self._log_lock:
+                self._close_log_handle()
             self.log_file = file_path
             self.log_message(f"Log file set to: {file_path}")
         except Exception as e:
             print(f"Failed to set log file: {e}")
     
+    def _open_log_handle(self, file_path):
+        """파일 핸들러와 버퍼 핸들러를 만들어 로거에 연결 (호출 측에서 잠금 보유)"""
+        file_handler = logging.FileHandler(file_path, mode='a', encoding='utf-8')
+        file_handler.setFormatter(logging.Formatter('%(message)s'))
+        self._log_handler = logging.handlers.MemoryHandler(
+            self.LOG_FLUSH_INTERVAL, flushLevel=logging.WARNING, target=file_handler)
+        self._logger.addHandler(self._log_handler)
+        self._log_fh_path = file_path
+    
+    def _close_log_handle(self):
+        """버퍼를 flush하고 로그 핸들러 닫기 (호출 측에서 잠금 보유)"""
+        if self._log_handler is not None:
+            self._logger.removeHandler(self._log_handler)
+            file_handler = self._log_handler.target
+            self._log_handler.close()
+            file_handler.close()
+            self._log_handler = None
+            self._log_fh_path = None
+    
+    def close(self):
+        """로그 파일 핸들을 flush하고 닫기"""
+        with self._log_lock:
+            self._close_log_handle()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass
+    
     def create_backup(self, source_file, backup_dir=None):
         """파일 백업 생성"""
         if not os.path.exists(source_file):
@@ -385,7 +890,9 @@ class Utils:
         if backup_dir is None:
             backup_dir = os.path.dirname(source_file) + "_backups"
         
-        os.makedirs(backup_dir, exist_ok=True)
+        # 이미 있는 디렉터리면 makedirs 호출 생략
+        if backup_dir and not os.path.isdir(backup_dir):
+            os.makedirs(backup_dir, exist_ok=True)
         
         # 백업 파일명 생성
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
@@ -394,9 +901,23 @@ class Utils:
         backup_filename = f"{name}_{timestamp}{ext}"
         backup_path = os.path.join(backup_dir, backup_filename)
         
-        # 파일 복사
+        # 파일 복사 (가능하면 커널 내 복사 os.sendfile, 아니면 1MB 버퍼 복사) 후 메타데이터 복사
         import shutil
-        shutil.copy2(source_file, backup_path)
+        with open(source_file, 'rb') as src, open(backup_path, 'wb') as dst:
+            try:
+                size = os.fstat(src.fileno()).st_size
+                offset = 0
+                while offset < size:
+                    sent = os.sendfile(dst.fileno(), src.fileno(), offset, size - offset)
+                    if sent == 0:
+                        break
+                    offset += sent
+            except (AttributeError, OSError):
+                src.seek(0)
+                dst.seek(0)
+                dst.truncate()
+                shutil.copyfileobj(src, dst, 1 << 20)
+        shutil.copystat(source_file, backup_path)
         
         self.log_message(f"Backup created: {backup_path}")
         return backup_path
@@ -409,24 +930,35 @@ class Utils:
         if data_array.size == 0:
             return {'error': 'Empty data array'}
         
+        flat = data_array.ravel()
+        values = flat.astype(np.float64, copy=False)
+        n = flat.size
+        
+        # 세 분위수는 한 번의 분할로 계산, 합/제곱합은 dot으로 중간 배열 없이 계산
+        q25, median, q75 = np.quantile(values, [0.25, 0.5, 0.75])
+        total = values.sum()
+        mean = total / n
+        centered = values - mean
+        data_min, data_max = flat.min(), flat.max()
+        
         stats = {
-            'count': data_array.size,
-            'mean': np.mean(data_array),
-            'median': np.median(data_array),
-            'std': np.std(data_array),
-            'min': np.min(data_array),
-            'max': np.max(data_array),
-            'range': np.max(data_array) - np.min(data_array),
-            'percentile_25': np.percentile(data_array, 25),
-            'percentile_75': np.percentile(data_array, 75)
+            'count': n,
+            'mean': mean,
+            'median': median,
+            'std': np.sqrt(np.dot(centered, centered) / n),
+            'min': data_min,
+            'max': data_max,
+            'range': data_max - data_min,
+            'percentile_25': q25,
+            'percentile_75': q75
         }
         
-        # 추가 통계
-        non_zero_data = data_array[data_array != 0]
-        if non_zero_data.size > 0:
-            stats['non_zero_count'] = non_zero_data.size
-            stats['non_zero_mean'] = np.mean(non_zero_data)
-            stats['rms'] = np.sqrt(np.mean(data_array**2))
+        # 추가 통계 (0은 합에 기여하지 않으므로 0이 아닌 값의 평균 = 전체 합 / 개수)
+        non_zero_count = np.count_nonzero(flat)
+        if non_zero_count > 0:
+            stats['non_zero_count'] = non_zero_count
+            stats['non_zero_mean'] = total / non_zero_count
+            stats['rms'] = np.sqrt(np.dot(values, values) / n)
         
         return stats
     
@@ -445,7 +977,9 @@ class Utils:
             return numerator / denominator
     
     def clamp(self, value, min_value, max_value):
-        """값을 지정된 범위로 제한"""
+        """값을 지정된 범위로 제한 (배열/시퀀스는 np.clip으로 한 번에 처리)"""
+        if isinstance(value, (np.ndarray, list, tuple)):
+            return np.clip(value, min_value, max_value)
         return max(min_value, min(max_value, value))
     
     def linear_map(self, value, from_range, to_range):
@@ -453,13 +987,14 @@ class Utils:
         from_min, from_max = from_range
         to_min, to_max = to_range
         
-        # 입력 범위에서의 비율 계산
-        ratio = (value - from_min) / (from_max - from_min)
+        # 스케일과 오프셋을 먼저 계산해 값마다 곱셈-덧셈 한 번으로 처리
+        scale = (to_max - to_min) / (from_max - from_min)
+        offset = to_min - from_min * scale
         
-        # 출력 범위로 매핑
-        mapped_value = to_min + ratio * (to_max - to_min)
+        if isinstance(value, (list, tuple)):
+            value = np.asarray(value, dtype=float)
         
-        return mapped_value
+        return value * scale + offset
     
     def moving_average(self, data, window_size):
         """이동 평균 계산"""
@@ -470,9 +1005,11 @@ class Utils:
         if len(data_array) < window_size:
             return data_array
         
-        # 컨볼루션을 이용한 이동 평균
-        kernel = np.ones(window_size) / window_size
-        smoothed = np.convolve(data_array, kernel, mode='valid')
+        # 누적합을 이용한 이동 평균 (창 크기와 무관하게 O(N))
+        # 평균을 빼고 누적하여 긴 신호에서의 자릿수 손실을 줄임
+        offset = data_array.mean()
+        cs = np.cumsum(np.insert(data_array - offset, 0, 0.0))
+        smoothed = (cs[window_size:] - cs[:-window_size]) / window_size + offset
         
         # 시작 부분 패딩
         padding = np.full(window_size - 1, smoothed[0])
@@ -480,39 +1017,48 @@ class Utils:
         
         return result
     
-    def find_peaks(self, data, threshold=None, min_distance=1):
-        """데이터에서 피크 찾기"""
+    def find_peaks(self, data, threshold=None, min_distance=1, as_array=False):
+        """데이터에서 피크 찾기 (as_array=True이면 인덱스를 ndarray로 반환)"""
         data_array = np.array(data)
         
         if threshold is None:
             threshold = np.mean(data_array) + np.std(data_array)
         
-        peaks = []
-        for i in range(1, len(data_array) - 1):
-            if (data_array[i] > data_array[i-1] and 
-                data_array[i] > data_array[i+1] and 
-                data_array[i] > threshold):
-                
-                # 최소 거리 조건 확인
-                if not peaks or i - peaks[-1] >= min_distance:
-                    peaks.append(i)
+        # 양 옆보다 크고 임계값을 넘는 후보를 한 번에 찾기
+        center = data_array[1:-1]
+        mask = (center > data_array[:-2]) & (center > data_array[2:]) & (center > threshold)
+        candidates = np.nonzero(mask)[0] + 1
         
-        return peaks
+        # 최소 거리 조건 확인 (후보가 많지 않으므로 순차 처리)
+        if min_distance > 1 and len(candidates) > 1:
+            keep = np.zeros(len(candidates), dtype=bool)
+            last = None
+            for k, i in enumerate(candidates):
+                if last is None or i - last >= min_distance:
+                    keep[k] = True
+                    last = i
+            candidates = candidates[keep]
+        
+        return candidates if as_array else candidates.tolist()
     
     def get_system_info(self):
-        """시스템 정보 수집"""
-        import platform
-        import psutil
-        
-        info = {
-            'python_version': platform.python_version(),
-            'platform': platform.platform(),
-            'processor': platform.processor(),
-            'cpu_count': psutil.cpu_count(),
-            'memory_total_gb': round(psutil.virtual_memory().total / (1024**3), 2),
-            'memory_available_gb': round(psutil.virtual_memory().available / (1024**3), 2),
-            'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-        }
+        """시스템 정보 수집 (프로세스 동안 변하지 않는 항목은 첫 호출 때만 조회)"""
+        if not hasattr(self, '_sysinfo_static'):
+            import platform
+            import psutil
+            
+            self._psutil = psutil
+            self._sysinfo_static = {
+                'python_version': platform.python_version(),
+                'platform': platform.platform(),
+                'processor': platform.processor(),
+                'cpu_count': psutil.cpu_count(),
+                'memory_total_gb': round(psutil.virtual_memory().total / (1024**3), 2)
+            }
+        
+        info = dict(self._sysinfo_static)
+        info['memory_available_gb'] = round(self._psutil.virtual_memory().available / (1024**3), 2)
+        info['timestamp'] = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
         
         return info
     
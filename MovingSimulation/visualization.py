@@ -9,8 +9,55 @@ visualization.py - MovingSimulation/visualization.py
 - 애니메이션 지원
 """
 
+import math
 import numpy as np
 import matplotlib.pyplot as plt
+import matplotlib.colors as mcolors
+from mpl_toolkits.mplot3d.art3d import Line3DCollection
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+if NUMBA_AVAILABLE:
+    # cache=True는 쓰지 않음: 디스크 캐시가 처음 컴파일한 모듈 이름에 묶여
+    # 'visualization' / 'MovingSimulation.visualization' 중 다른 이름으로 import하면 실패함
+    # 시그니처도 지정하지 않음: 첫 호출 때 컴파일하여 import 시간에 컴파일 비용을 물리지 않음
+    @njit(fastmath=True)
+    def _chain_link_positions_kernel(R0, A, B, t0, ta, tb, q, positions):
+        """관절 상수로 링크 위치를 누적 계산하는 커널 (3x3 곱을 스칼라 루프로 전개)"""
+        R_cum = np.eye(3)
+        R_i = np.empty((3, 3))
+        R_next = np.empty((3, 3))
+        positions[0, 0] = 0.0
+        positions[0, 1] = 0.0
+        positions[0, 2] = 0.0
+        for i in range(q.shape[0]):
+            s = math.sin(q[i])
+            omc = 1.0 - math.cos(q[i])
+            # p_(i+1) = p_i + R_cum·t_i
+            for r in range(3):
+                acc = positions[i, r]
+                for k in range(3):
+                    acc += R_cum[r, k] * (t0[i, k] + s * ta[i, k] + omc * tb[i, k])
+                positions[i + 1, r] = acc
+            # R_cum ← R_cum·R_i
+            for r in range(3):
+                for c in range(3):
+                    R_i[r, c] = R0[i, r, c] + s * A[i, r, c] + omc * B[i, r, c]
+            for r in range(3):
+                for c in range(3):
+                    R_next[r, c] = R_cum[r, 0] * R_i[0, c] + R_cum[r, 1] * R_i[1, c] + R_cum[r, 2] * R_i[2, c]
+            R_cum, R_next = R_next, R_cum
+    
+    @njit(parallel=True, fastmath=True)
+    def _chain_link_positions_batch_kernel(R0, A, B, t0, ta, tb, Q, positions):
+        """여러 관절 각도 세트(프레임)의 링크 위치 커널 (프레임 단위 병렬화)"""
+        for f in prange(Q.shape[0]):
+            _chain_link_positions_kernel(R0, A, B, t0, ta, tb, Q[f], positions[f])
 
 class RobotVisualizer:
     def __init__(self):
@@ -33,148 +80,299 @@ class RobotVisualizer:
         self.joint_size = 8.0
         self.frame_length = 15.0
         self.workspace_alpha = 0.1
+        self.workspace_max_points = 50_000
+        self.history_max_points = 500
         
         # 그래프 스타일
         self.grid_alpha = 0.3
         self.background_color = 'white'
         
-    def compute_link_positions(self, dh_params, joint_angles):
+        # 색상 문자열을 RGBA로 미리 변환 (그리기마다 다시 파싱하지 않음)
+        self._update_rgba_cache()
+        
+        # DH 테이블별 관절 상수 캐시 (DH 배열 바이트 → (R0, A, B, t0, ta, tb))
+        self._joint_cache = {}
+        self.JOINT_CACHE_SIZE = 32
+        
+        # 작업공간 경계 구의 단위 메쉬 (경도 12 x 위도 6, 그릴 때 반경만 곱함)
+        u, v = np.meshgrid(np.linspace(0, 2 * np.pi, 12), np.linspace(0, np.pi, 6), indexing='ij')
+        self._sphere_unit = np.stack([np.cos(u) * np.sin(v), np.sin(u) * np.sin(v), np.cos(v)])
+        # 작업반경별로 확대한 메쉬 캐시 (읽기 전용, 추정 반경은 몇 가지 값뿐)
+        self._sphere_scaled = {}
+        
+    def compute_link_positions(self, dh_params, joint_angles, as_list=False):
         """DH 파라미터와 관절 각도로부터 각 링크의 위치 계산
         
         Args:
             dh_params (list): DH 파라미터 [[a, alpha, d, theta], ...]
             joint_angles (list): 관절 각도 (라디안)
+            as_list (bool): True이면 이전처럼 [[x, y, z], ...] 리스트로 반환
             
         Returns:
-            list: 각 링크 끝의 위치 리스트 [[x, y, z], ...]
+            numpy.ndarray: 베이스와 각 링크 끝의 위치 (n+1, 3) [cm]
         """
-        positions = [[0, 0, 0]]
-        T_cumulative = np.eye(4)
-        
-        for i, (dh_param, joint_angle) in enumerate(zip(dh_params, joint_angles)):
-            a, alpha_deg, d, theta_offset_deg = dh_param
-            
-            # 각도를 라디안으로 변환
-            alpha = np.radians(alpha_deg)
-            theta_offset = np.radians(theta_offset_deg)
-            theta = joint_angle + theta_offset
-            
-            # cm를 m로 변환
-            a_m = a / 100.0
-            d_m = d / 100.0
-            
-            # DH 변환 행렬
-            cos_theta = np.cos(theta)
-            sin_theta = np.sin(theta)
-            cos_alpha = np.cos(alpha)
-            sin_alpha = np.sin(alpha)
-            
-            T_i = np.array([
-                [cos_theta, -sin_theta * cos_alpha,  sin_theta * sin_alpha, a_m * cos_theta],
-                [sin_theta,  cos_theta * cos_alpha, -cos_theta * sin_alpha, a_m * sin_theta],
-                [0,          sin_alpha,              cos_alpha,             d_m],
-                [0,          0,                      0,                     1]
-            ])
-            
-            T_cumulative = np.dot(T_cumulative, T_i)
-            
-            # 현재 링크 끝의 위치 추출 (m를 cm로 변환)
-            position = T_cumulative[:3, 3] * 100
-            positions.append(position.tolist())
+        positions = self._link_positions(dh_params, joint_angles)
+        return positions.tolist() if as_list else positions
+    
+    def _link_positions(self, dh_params, joint_angles):
+        """링크 위치 (n+1, 3) 배열 계산 [cm]"""
+        dh = np.ascontiguousarray(dh_params, dtype=np.float64)
+        q = np.asarray(joint_angles, dtype=float).ravel()
+        n = min(len(dh), len(q))
+        
+        positions = np.zeros((n + 1, 3))
+        if n == 0:
+            return positions
+        
+        # 관절 수가 DH 행 수보다 적으면 앞쪽 관절 상수만 사용 (앞쪽 행 슬라이스는 연속 배열)
+        R0, A, B, t0, ta, tb = (c[:n] for c in self._joint_constants(dh))
+        
+        if NUMBA_AVAILABLE:
+            _chain_link_positions_kernel(R0, A, B, t0, ta, tb, np.ascontiguousarray(q[:n]), positions)
+            return positions
+        
+        # Rz(q)를 로드리게스 형식 I + sin(q)·K + (1 - cos(q))·K²로 펼쳐
+        # 관절마다 sin/cos 한 번과 곱셈-덧셈만으로 회전/평행이동을 구성
+        sin_q = np.sin(q[:n])
+        one_minus_cos_q = 1.0 - np.cos(q[:n])
+        R = R0 + sin_q[:, None, None] * A + one_minus_cos_q[:, None, None] * B
+        t = t0 + sin_q[:, None] * ta + one_minus_cos_q[:, None] * tb
+        
+        # 회전(3x3)과 위치만 순서대로 누적 (DH 길이가 cm이므로 위치도 cm)
+        # 중간 결과는 미리 할당한 버퍼에 out=으로 기록 (회전은 두 버퍼를 번갈아 사용)
+        R_cumulative = R[0].copy()
+        R_scratch = np.empty((3, 3))
+        offset = np.empty(3)
+        positions[1] = t[0]
+        for i in range(1, n):
+            np.matmul(R_cumulative, t[i], out=offset)
+            np.add(positions[i], offset, out=positions[i + 1])
+            np.matmul(R_cumulative, R[i], out=R_scratch)
+            R_cumulative, R_scratch = R_scratch, R_cumulative
         
         return positions
     
-    def draw_robot_links(self, ax, link_positions):
-        """로봇 링크를 3D 공간에 그리기"""
-        # 링크들을 선으로 연결
-        for i in range(len(link_positions) - 1):
-            start_pos = link_positions[i]
-            end_pos = link_positions[i + 1]
+    def compute_link_positions_batch(self, dh_params, joint_angles_batch):
+        """여러 프레임의 링크 위치를 한 번에 계산
+        
+        Args:
+            dh_params (list): DH 파라미터 [[a, alpha, d, theta], ...]
+            joint_angles_batch (array_like): (F, n) 프레임별 관절 각도 (라디안)
             
-            # 링크 색상 (베이스는 다른 색상)
-            if i == 0:
-                color = self.colors['base']
-                linewidth = self.link_width + 1
-                alpha = 1.0
-            else:
-                color = self.colors['link']
-                linewidth = self.link_width
-                alpha = 0.8
+        Returns:
+            numpy.ndarray: (F, n+1, 3) 프레임별 링크 위치 [cm]
+        """
+        dh = np.ascontiguousarray(dh_params, dtype=np.float64)
+        Q = np.atleast_2d(np.asarray(joint_angles_batch, dtype=np.float64))
+        n = min(len(dh), Q.shape[1])
+        
+        positions = np.zeros((len(Q), n + 1, 3))
+        if n == 0 or len(Q) == 0:
+            return positions
+        
+        R0, A, B, t0, ta, tb = (c[:n] for c in self._joint_constants(dh))
+        Q = np.ascontiguousarray(Q[:, :n])
+        
+        if NUMBA_AVAILABLE:
+            _chain_link_positions_batch_kernel(R0, A, B, t0, ta, tb, Q, positions)
+            return positions
+        
+        # 모든 프레임의 관절 회전/평행이동을 한 번에 구성한 뒤 관절 축으로만 누적
+        # (matmul이 프레임 축 F로 브로드캐스트되므로 파이썬 루프는 관절 수 n번)
+        sin_q = np.sin(Q)
+        one_minus_cos_q = 1.0 - np.cos(Q)
+        R = R0 + sin_q[..., None, None] * A + one_minus_cos_q[..., None, None] * B
+        t = t0 + sin_q[..., None] * ta + one_minus_cos_q[..., None] * tb
+        
+        R_cumulative = R[:, 0]
+        positions[:, 1] = t[:, 0]
+        for j in range(1, n):
+            positions[:, j + 1] = positions[:, j] + np.matmul(R_cumulative, t[:, j, :, None])[..., 0]
+            R_cumulative = R_cumulative @ R[:, j]
+        return positions
+    
+    def _joint_constants(self, dh):
+        """관절 각도와 무관한 DH 상수를 미리 계산 (같은 DH 테이블이면 캐시 재사용)
+        
+        관절 i의 변환은 Rz(q)·Rz(theta)·Tx(a)·Rx(alpha) + d·z 이므로
+        R_i = R0 + sin(q)·A + (1 - cos(q))·B,  t_i = t0 + sin(q)·ta + (1 - cos(q))·tb
+        (A = K·R0, B = K²·R0, K는 z축 반대칭 행렬)로 쓸 수 있다.
+        
+        Args:
+            dh (numpy.ndarray): (n, 4) DH 파라미터 [a(cm), alpha(deg), d(cm), theta(deg)]
             
-            ax.plot([start_pos[0], end_pos[0]], 
-                   [start_pos[1], end_pos[1]], 
-                   [start_pos[2], end_pos[2]], 
-                   color=color, linewidth=linewidth, alpha=alpha)
+        Returns:
+            tuple: (R0, A, B) 각 (n, 3, 3), (t0, ta, tb) 각 (n, 3) [cm]
+        """
+        key = dh.tobytes()
+        cached = self._joint_cache.get(key)
+        if cached is not None:
+            return cached
+        
+        alpha = np.radians(dh[:, 1])
+        theta_offset = np.radians(dh[:, 3])
+        cos_theta, sin_theta = np.cos(theta_offset), np.sin(theta_offset)
+        cos_alpha, sin_alpha = np.cos(alpha), np.sin(alpha)
+        
+        # R0 = Rz(theta_offset)·Rx(alpha)
+        R0 = np.zeros((len(dh), 3, 3))
+        R0[:, 0, 0] = cos_theta
+        R0[:, 0, 1] = -sin_theta * cos_alpha
+        R0[:, 0, 2] = sin_theta * sin_alpha
+        R0[:, 1, 0] = sin_theta
+        R0[:, 1, 1] = cos_theta * cos_alpha
+        R0[:, 1, 2] = -cos_theta * sin_alpha
+        R0[:, 2, 1] = sin_alpha
+        R0[:, 2, 2] = cos_alpha
+        
+        t0 = np.stack([dh[:, 0] * cos_theta, dh[:, 0] * sin_theta, dh[:, 2]], axis=-1)
+        
+        # K·M은 [-M[1], M[0], 0], K²·M은 [-M[0], -M[1], 0]
+        A = np.zeros_like(R0)
+        A[:, 0] = -R0[:, 1]
+        A[:, 1] = R0[:, 0]
+        B = np.zeros_like(R0)
+        B[:, :2] = -R0[:, :2]
+        
+        ta = np.zeros_like(t0)
+        ta[:, 0] = -t0[:, 1]
+        ta[:, 1] = t0[:, 0]
+        tb = np.zeros_like(t0)
+        tb[:, :2] = -t0[:, :2]
+        
+        if len(self._joint_cache) >= self.JOINT_CACHE_SIZE:
+            self._joint_cache.clear()
+        self._joint_cache[key] = constants = (R0, A, B, t0, ta, tb)
+        return constants
+    
+    def draw_robot_links(self, ax, link_positions):
+        """로봇 링크를 3D 공간에 그리기 (모든 링크를 Line3DCollection 하나로)
+        
+        위치가 2개 미만이면 그릴 링크가 없으므로 축에 추가하지 않는다
+        (선분이 없는 컬렉션은 add_collection3d에서 오류).
+        
+        Returns:
+            Line3DCollection: 링크 아티스트 (set_segments로 재사용 가능)
+        """
+        pos = np.asarray(link_positions, dtype=float)
+        links = Line3DCollection(self._link_segments(pos), **self._link_styles(max(len(pos) - 1, 0)))
+        if len(pos) >= 2:
+            ax.add_collection3d(links)
+        return links
+    
+    def _link_segments(self, pos):
+        """(n+1, 3) 링크 위치 → (n, 2, 3) 선분 배열"""
+        return np.stack([pos[:-1], pos[1:]], axis=1)
+    
+    def _link_styles(self, n_links):
+        """링크별 색상/선 굵기 (베이스 링크는 다른 색상, 알파는 RGBA에 포함)"""
+        colors = [self._rgba['base']] + [mcolors.to_rgba(self._rgba['link'], 0.8)] * (n_links - 1)
+        linewidths = [self.link_width + 1] + [self.link_width] * (n_links - 1)
+        return dict(colors=colors[:n_links], linewidths=linewidths[:n_links])
     
     def draw_joints(self, ax, link_positions):
-        """관절을 구 형태로 그리기"""
-        for i, pos in enumerate(link_positions):
-            if i == 0:
-                # 베이스
-                ax.scatter(pos[0], pos[1], pos[2], 
-                          c=self.colors['base'], s=self.joint_size * 2, 
-                          alpha=1.0, marker='s', edgecolors='black', linewidth=1)
-            elif i == len(link_positions) - 1:
-                # End-effector
-                ax.scatter(pos[0], pos[1], pos[2], 
-                          c=self.colors['end_effector'], s=self.joint_size * 1.5, 
-                          alpha=1.0, marker='^', edgecolors='black', linewidth=1)
-            else:
-                # 일반 관절
-                ax.scatter(pos[0], pos[1], pos[2], 
-                          c=self.colors['joint'], s=self.joint_size, 
-                          alpha=1.0, marker='o', edgecolors='black', linewidth=1)
+        """관절을 구 형태로 그리기 (베이스/중간 관절/End-effector 각각 scatter 한 번)"""
+        pos = np.asarray(link_positions, dtype=float)
+        if len(pos) == 0:
+            return
+        
+        # 베이스 (RGBA 튜플은 c=로 넘기면 점별 값으로 해석될 수 있어 color=로 전달)
+        ax.scatter(pos[0, 0], pos[0, 1], pos[0, 2], 
+                  color=self._rgba['base'], s=self.joint_size * 2, 
+                  alpha=1.0, marker='s', edgecolors='black', linewidth=1)
+        
+        # 일반 관절 (모든 중간 관절을 하나의 scatter로)
+        if len(pos) > 2:
+            middle = pos[1:-1]
+            # depthshade=False: 점마다 개별 scatter로 그리던 때와 같은 불투명도 유지
+            ax.scatter(middle[:, 0], middle[:, 1], middle[:, 2], 
+                      color=self._rgba['joint'], s=self.joint_size, 
+                      alpha=1.0, marker='o', edgecolors='black', linewidth=1,
+                      depthshade=False)
+        
+        # End-effector
+        if len(pos) > 1:
+            ax.scatter(pos[-1, 0], pos[-1, 1], pos[-1, 2], 
+                      color=self._rgba['end_effector'], s=self.joint_size * 1.5, 
+                      alpha=1.0, marker='^', edgecolors='black', linewidth=1)
     
     def draw_coordinate_frames(self, ax, transformation_matrices, frame_length=None):
         """각 링크의 좌표계 그리기"""
         if frame_length is None:
             frame_length = self.frame_length
         
-        for i, T in enumerate(transformation_matrices):
-            # 원점 위치 (m를 cm로 변환)
-            origin = T[:3, 3] * 100
-            
-            # 각 축의 방향 벡터
-            x_axis = T[:3, 0] * frame_length / 100
-            y_axis = T[:3, 1] * frame_length / 100
-            z_axis = T[:3, 2] * frame_length / 100
-            
-            # X축 (빨간색)
-            ax.quiver(origin[0], origin[1], origin[2],
-                     x_axis[0] * 100, x_axis[1] * 100, x_axis[2] * 100,
-                     color=self.colors['frame_x'], alpha=0.8, 
-                     arrow_length_ratio=0.1, linewidth=2)
-            
-            # Y축 (초록색)
-            ax.quiver(origin[0], origin[1], origin[2],
-                     y_axis[0] * 100, y_axis[1] * 100, y_axis[2] * 100,
-                     color=self.colors['frame_y'], alpha=0.8, 
-                     arrow_length_ratio=0.1, linewidth=2)
-            
-            # Z축 (파란색)
-            ax.quiver(origin[0], origin[1], origin[2],
-                     z_axis[0] * 100, z_axis[1] * 100, z_axis[2] * 100,
-                     color=self.colors['frame_z'], alpha=0.8, 
+        Ts = np.asarray(transformation_matrices, dtype=float)
+        if len(Ts) == 0:
+            return
+        
+        # 모든 프레임의 원점 (m를 cm로 변환)과 축 방향 벡터 (길이 frame_length cm)
+        origins = Ts[:, :3, 3] * 100
+        axes_dirs = Ts[:, :3, :3] * frame_length
+        
+        # 축마다 quiver 한 번으로 모든 프레임을 그림 (X: 빨강, Y: 초록, Z: 파랑)
+        for k, color_key in enumerate(('frame_x', 'frame_y', 'frame_z')):
+            dirs = axes_dirs[:, :, k]
+            ax.quiver(origins[:, 0], origins[:, 1], origins[:, 2],
+                     dirs[:, 0], dirs[:, 1], dirs[:, 2],
+                     color=self._rgba[color_key], alpha=0.8,
                      arrow_length_ratio=0.1, linewidth=2)
-            
-            # 프레임 번호 표시
-            if i > 0:
-                ax.text(origin[0] + 5, origin[1] + 5, origin[2] + 5, 
-                       f'{i}', fontsize=8, color='black', alpha=0.7)
+        
+        # 프레임 번호 표시
+        for i in range(1, len(origins)):
+            ax.text(origins[i, 0] + 5, origins[i, 1] + 5, origins[i, 2] + 5,
+                   f'{i}', fontsize=8, color='black', alpha=0.7)
     
-    def draw_workspace(self, ax, dof, workspace_points=None):
-        """로봇의 작업 공간 시각화"""
+    def draw_workspace(self, ax, dof, workspace_points=None, max_points=None, voxel_size=None,
+                       color_by=None, cmap='viridis'):
+        """로봇의 작업 공간 시각화
+        
+        Args:
+            ax: 3D 축
+            dof (int): 자유도 (작업공간 점이 없을 때 추정 반경에 사용)
+            workspace_points (numpy.ndarray): (N, 3) 작업공간 점 [m]
+            max_points (int): 그릴 최대 점 수 (기본값 self.workspace_max_points, 초과 시 무작위 추출)
+            voxel_size (float): 지정 시 이 크기 [cm]의 격자마다 점 하나만 남김
+            color_by (str): 'x', 'y', 'z' 중 하나이면 해당 좌표로 점 색상 지정 (None이면 단일 색상)
+            cmap (str): color_by 사용 시 컬러맵
+        """
         if workspace_points is not None:
             # 제공된 작업공간 점들 사용
-            points = workspace_points * 100
+            points = self._decimate_points(np.asarray(workspace_points, dtype=float) * 100,
+                                           max_points, voxel_size)
+            
+            if color_by is None:
+                # 단일 색상: scatter의 빠른 경로 (점별 정규화/컬러맵 처리 없음)
+                # RGBA 튜플은 c=로 넘기면 점 4개일 때 값으로 해석될 수 있어 color=로 전달
+                color_kw = dict(color=self._rgba['workspace'])
+            else:
+                # 점별 색상은 정규화+컬러맵을 여기서 한 번만 적용한 (N, 4) RGBA로 전달
+                values = points[:, 'xyz'.index(color_by.lower())]
+                norm = mcolors.Normalize(values.min(), values.max()) if len(values) else mcolors.Normalize()
+                color_kw = dict(c=plt.get_cmap(cmap)(norm(values)))
             
             ax.scatter(points[:, 0], points[:, 1], points[:, 2], 
-                      c=self.colors['workspace'], alpha=self.workspace_alpha,
-                      s=1, marker='.')
+                      alpha=self.workspace_alpha, s=1, marker='.', **color_kw)
         else:
             # 간단한 작업공간 추정
             self._draw_simple_workspace(ax, dof)
     
+    def _decimate_points(self, points, max_points=None, voxel_size=None):
+        """렌더링할 점 수를 줄이기 (복셀 격자 솎아내기 후 최대 개수까지 무작위 추출)"""
+        if max_points is None:
+            max_points = self.workspace_max_points
+        
+        if voxel_size:
+            keys = np.floor(points / voxel_size).astype(np.int64)
+            _, first = np.unique(keys, axis=0, return_index=True)
+            points = points[np.sort(first)]
+        
+        if max_points and len(points) > max_points:
+            # 시드 고정: 같은 입력이면 매번 같은 점을 선택
+            idx = np.random.default_rng(0).choice(len(points), max_points, replace=False)
+            points = points[np.sort(idx)]
+        
+        return points
+    
     def _draw_simple_workspace(self, ax, dof):
         """간단한 작업공간 표시 (추정값)"""
         # 기본 작업반경 추정 (cm)
@@ -185,22 +383,25 @@ class RobotVisualizer:
         else:
             max_reach = 100
         
-        # 구형 작업공간 경계 표시
-        u = np.linspace(0, 2 * np.pi, 20)
-        v = np.linspace(0, np.pi, 10)
-        
-        x_sphere = max_reach * np.outer(np.cos(u), np.sin(v))
-        y_sphere = max_reach * np.outer(np.sin(u), np.sin(v))
-        z_sphere = max_reach * np.outer(np.ones(np.size(u)), np.cos(v))
-        
+        # 구형 작업공간 경계 표시 (미리 만든 저해상도 단위 메쉬를 반경만큼 확대)
+        x_sphere, y_sphere, z_sphere = self._workspace_sphere(max_reach)
         ax.plot_wireframe(x_sphere, y_sphere, z_sphere, 
-                         color=self.colors['workspace'], 
+                         color=self._rgba['workspace'], 
                          alpha=self.workspace_alpha, linewidth=0.5)
     
+    def _workspace_sphere(self, radius):
+        """반경 radius인 작업공간 구 메쉬 (3, 경도, 위도) - 반경별로 한 번만 계산"""
+        sphere = self._sphere_scaled.get(radius)
+        if sphere is None:
+            sphere = radius * self._sphere_unit
+            sphere.flags.writeable = False
+            self._sphere_scaled[radius] = sphere
+        return sphere
+    
     def draw_trajectory(self, ax, trajectory_points, color=None, label="Trajectory"):
         """End-effector 궤적 그리기"""
         if color is None:
-            color = self.colors['trajectory']
+            color = self._rgba['trajectory']
         
         # m를 cm로 변환
         points = trajectory_points * 100
@@ -258,42 +459,20 @@ class RobotVisualizer:
         fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(12, 6))
         
         # 링크 위치 계산
-        link_positions = self.compute_link_positions(dh_params, joint_angles)
-        positions = np.array(link_positions)
-        
-        # 측면도 (X-Z 평면)
-        ax1.plot(positions[:, 0], positions[:, 2], 'o-', 
-                color=self.colors['link'], linewidth=3, markersize=8)
-        ax1.scatter(positions[0, 0], positions[0, 2], 
-                   c=self.colors['base'], s=100, marker='s', 
-                   edgecolors='black', linewidth=2, label='Base')
-        ax1.scatter(positions[-1, 0], positions[-1, 2], 
-                   c=self.colors['end_effector'], s=100, marker='^', 
-                   edgecolors='black', linewidth=2, label='End-Effector')
+        positions = self.compute_link_positions(dh_params, joint_angles)
         
-        ax1.set_xlabel('X (cm)')
-        ax1.set_ylabel('Z (cm)')
-        ax1.set_title('측면도 (X-Z Plane)')
-        ax1.grid(True, alpha=0.3)
-        ax1.legend()
-        ax1.axis('equal')
-        
-        # 평면도 (X-Y 평면)
-        ax2.plot(positions[:, 0], positions[:, 1], 'o-', 
-                color=self.colors['link'], linewidth=3, markersize=8)
-        ax2.scatter(positions[0, 0], positions[0, 1], 
-                   c=self.colors['base'], s=100, marker='s', 
-                   edgecolors='black', linewidth=2, label='Base')
-        ax2.scatter(positions[-1, 0], positions[-1, 1], 
-                   c=self.colors['end_effector'], s=100, marker='^', 
-                   edgecolors='black', linewidth=2, label='End-Effector')
+        # 두 투영에 공통으로 쓰는 스타일은 한 번만 구성
+        link_style = dict(color=self._rgba['link'], linewidth=3, markersize=8)
+        base_style = dict(color=self._rgba['base'], s=100, marker='s',
+                          edgecolors='black', linewidth=2, label='Base')
+        ee_style = dict(color=self._rgba['end_effector'], s=100, marker='^',
+                        edgecolors='black', linewidth=2, label='End-Effector')
         
-        ax2.set_xlabel('X (cm)')
-        ax2.set_ylabel('Y (cm)')
+        # 측면도 (X-Z 평면), 평면도 (X-Y 평면)
+        self._draw_projection(ax1, positions, 0, 2, link_style, base_style, ee_style)
+        ax1.set_title('측면도 (X-Z Plane)')
+        self._draw_projection(ax2, positions, 0, 1, link_style, base_style, ee_style)
         ax2.set_title('평면도 (X-Y Plane)')
-        ax2.grid(True, alpha=0.3)
-        ax2.legend()
-        ax2.axis('equal')
         
         plt.tight_layout()
         
@@ -303,39 +482,80 @@ class RobotVisualizer:
         
         return fig
     
-    def animate_robot_motion(self, ax, dh_params, trajectory_data, interval=100):
-        """로봇 움직임 애니메이션 설정"""
+    def _draw_projection(self, ax, positions, ix, iy, link_style, base_style, ee_style):
+        """링크 위치를 (ix, iy) 열로 투영한 2D 개략도 그리기"""
+        projected = positions[:, [ix, iy]]
+        ax.plot(projected[:, 0], projected[:, 1], 'o-', **link_style)
+        ax.scatter(projected[0, 0], projected[0, 1], **base_style)
+        ax.scatter(projected[-1, 0], projected[-1, 1], **ee_style)
+        
+        axis_names = 'XYZ'
+        ax.set_xlabel(f'{axis_names[ix]} (cm)')
+        ax.set_ylabel(f'{axis_names[iy]} (cm)')
+        ax.grid(True, alpha=0.3)
+        ax.legend()
+        ax.axis('equal')
+    
+    def animate_robot_motion(self, ax, dh_params, trajectory_data, interval=100, blit=True):
+        """로봇 움직임 애니메이션 설정
+        
+        축과 아티스트는 한 번만 만들고 프레임마다 데이터만 갱신한다.
+        blit=True이면 바뀐 아티스트만 캐시된 배경 위에 다시 그린다.
+        """
         from matplotlib.animation import FuncAnimation
         
         positions_history = trajectory_data['positions']
         n_frames = len(positions_history)
         
+        # 모든 프레임의 링크 위치를 애니메이션 시작 전에 한 번에 계산
+        # (프레임마다 과거 프레임 전체를 다시 계산하던 O(N²) 작업 제거)
+        link_positions_all = self.compute_link_positions_batch(dh_params, positions_history)
+        first = link_positions_all[0] if n_frames else np.zeros((1, 3))
+        ee_trajectory = link_positions_all[:, -1]
+        
+        # 축 설정과 아티스트 생성은 한 번만 (프레임 번호는 축 안쪽 텍스트로 갱신)
+        ax.clear()
+        self.setup_3d_plot(ax, "Robot Animation")
+        frame_text = ax.text2D(0.02, 0.95, '', transform=ax.transAxes)
+        
+        links = Line3DCollection(self._link_segments(first), **self._link_styles(max(len(first) - 1, 0)))
+        if len(first) >= 2:
+            ax.add_collection3d(links)
+        history_line, = ax.plot([], [], [], color=self._rgba['trajectory'],
+                                alpha=0.5, linewidth=1)
+        base_scatter = ax.scatter([], [], [], color=self._rgba['base'], s=self.joint_size * 2,
+                                  alpha=1.0, marker='s', edgecolors='black', linewidth=1)
+        joint_scatter = ax.scatter([], [], [], color=self._rgba['joint'], s=self.joint_size,
+                                   alpha=1.0, marker='o', edgecolors='black', linewidth=1,
+                                   depthshade=False)
+        ee_scatter = ax.scatter([], [], [], color=self._rgba['end_effector'], s=self.joint_size * 1.5,
+                                alpha=1.0, marker='^', edgecolors='black', linewidth=1)
+        scatters = (base_scatter, joint_scatter, ee_scatter)
+        
         def animate_frame(frame):
-            ax.clear()
-            self.setup_3d_plot(ax, f"Robot Animation - Frame {frame+1}/{n_frames}")
+            frame_text.set_text(f"Frame {frame+1}/{n_frames}")
             
-            # 현재 프레임의 관절 각도
-            current_angles = positions_history[frame]
+            # 로봇 링크 (선분만 교체)
+            pos = link_positions_all[frame]
+            links.set_segments(self._link_segments(pos))
             
-            # 로봇 그리기
-            link_positions = self.compute_link_positions(dh_params, current_angles)
-            self.draw_robot_links(ax, link_positions)
-            self.draw_joints(ax, link_positions)
+            # 관절 (blit 시에는 Axes3D.draw를 거치지 않으므로 직접 투영)
+            base_scatter._offsets3d = (pos[:1, 0], pos[:1, 1], pos[:1, 2])
+            joint_scatter._offsets3d = (pos[1:-1, 0], pos[1:-1, 1], pos[1:-1, 2])
+            ee_scatter._offsets3d = (pos[-1:, 0], pos[-1:, 1], pos[-1:, 2])
+            for artist in (links,) + scatters:
+                artist.do_3d_projection()
             
-            # 궤적 히스토리 표시
-            if frame > 0:
-                history_positions = []
-                for i in range(frame + 1):
-                    hist_angles = positions_history[i]
-                    hist_link_pos = self.compute_link_positions(dh_params, hist_angles)
-                    history_positions.append(hist_link_pos[-1])
-                
-                history_array = np.array(history_positions)
-                ax.plot(history_array[:, 0], history_array[:, 1], history_array[:, 2],
-                       color=self.colors['trajectory'], alpha=0.5, linewidth=1)
+            # 궤적 히스토리 표시 (점 수가 history_max_points를 넘으면 일정 간격으로 솎아냄,
+            # 현재 프레임에서 거꾸로 잘라 마지막 점은 항상 포함)
+            stride = max(1, -(-(frame + 1) // self.history_max_points))
+            history_array = ee_trajectory[frame::-stride][::-1]
+            history_line.set_data_3d(history_array[:, 0], history_array[:, 1], history_array[:, 2])
+            
+            return (links, history_line) + scatters + (frame_text,)
         
         animation = FuncAnimation(fig=ax.figure, func=animate_frame, 
-                                frames=n_frames, interval=interval, repeat=True)
+                                frames=n_frames, interval=interval, repeat=True, blit=blit)
         
         return animation
     
@@ -356,20 +576,18 @@ class RobotVisualizer:
             if joint_idx in joint_limits:
                 min_angle, max_angle = joint_limits[joint_idx]
                 
-                # 원형 차트로 관절 범위 표시
-                angles = np.linspace(np.radians(min_angle), np.radians(max_angle), 100)
+                # 구간은 높이가 일정한 사각형이므로 양 끝점 두 개만으로 채움
+                min_rad, max_rad = np.radians(min_angle), np.radians(max_angle)
                 
                 # 허용 범위
-                ax.fill_between(angles, 0, 1, alpha=0.3, color='green', label='허용 범위')
+                ax.fill_between((min_rad, max_rad), 0, 1, alpha=0.3, color='green', label='허용 범위')
                 
                 # 금지 구역
                 if min_angle > -180:
-                    forbidden_angles1 = np.linspace(-np.pi, np.radians(min_angle), 50)
-                    ax.fill_between(forbidden_angles1, 0, 1, alpha=0.3, color='red', label='금지 구역')
+                    ax.fill_between((-np.pi, min_rad), 0, 1, alpha=0.3, color='red', label='금지 구역')
                 
                 if max_angle < 180:
-                    forbidden_angles2 = np.linspace(np.radians(max_angle), np.pi, 50)
-                    ax.fill_between(forbidden_angles2, 0, 1, alpha=0.3, color='red')
+                    ax.fill_between((max_rad, np.pi), 0, 1, alpha=0.3, color='red')
                 
                 ax.set_xlim(-np.pi, np.pi)
                 ax.set_ylim(0, 1.2)
@@ -426,15 +644,10 @@ class RobotVisualizer:
         
         # 작업공간 범위 분석
         ax3 = fig.add_subplot(223)
-        ranges = {
-            'X': [points[:, 0].min(), points[:, 0].max()],
-            'Y': [points[:, 1].min(), points[:, 1].max()],
-            'Z': [points[:, 2].min(), points[:, 2].max()]
-        }
-        
-        axes_names = list(ranges.keys())
-        min_vals = [ranges[axis][0] for axis in axes_names]
-        max_vals = [ranges[axis][1] for axis in axes_names]
+        # 축별 최소/최대를 열 단위 축소 두 번으로 계산
+        axes_names = ['X', 'Y', 'Z']
+        min_vals = points.min(axis=0)
+        max_vals = points.max(axis=0)
         
         x_pos = np.arange(len(axes_names))
         width = 0.35
@@ -452,7 +665,7 @@ class RobotVisualizer:
         
         # 도달거리 히스토그램
         ax4 = fig.add_subplot(224)
-        distances = np.sqrt(points[:, 0]**2 + points[:, 1]**2 + points[:, 2]**2)
+        distances = np.sqrt(np.einsum('ij,ij->i', points, points))
         ax4.hist(distances, bins=50, alpha=0.7, color='skyblue', edgecolor='black')
         ax4.set_xlabel('원점으로부터의 거리 (cm)')
         ax4.set_ylabel('빈도')
@@ -467,6 +680,10 @@ class RobotVisualizer:
         
         return fig
     
+    def _update_rgba_cache(self):
+        """self.colors의 각 색상을 RGBA 튜플로 변환해 캐시"""
+        self._rgba = {name: mcolors.to_rgba(color) for name, color in self.colors.items()}
+    
     def set_color_scheme(self, scheme='default'):
         """색상 스키마 변경"""
         if scheme == 'dark':
@@ -495,4 +712,6 @@ class RobotVisualizer:
                 'end_effector': '#999999',
                 'workspace': '#CCCCCC',
                 'trajectory': '#555555'
-            })
\ No newline at end of file
+            })
+        
+        self._update_rgba_cache()
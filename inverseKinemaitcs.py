@@ -4,7 +4,15 @@ import matplotlib.pyplot as plt
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 import numpy as np
 import koreanize_matplotlib # 한글 폰트 설정을 위해
+import math
 import sys
+import time
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
 
 # --- Constants ---
 MAX_REACH_SUM = 10.0
@@ -14,19 +22,51 @@ DECIMAL_PLACES = 2
 ANGLE_STEP = 1.0
 LENGTH_STEP = 0.1
 SINGULARITY_THRESHOLD_DEG = 5.0 # Degrees close to 0 or 180
+MIN_REDRAW_INTERVAL = 1.0 / 30 # Seconds between redraws while parameters change (~30 FPS)
+_SINGULARITY_THRESHOLD_RAD = math.radians(SINGULARITY_THRESHOLD_DEG)
+
+# inverse_kinematics 상태: 해 있음 / 목표가 전체 도달 거리 밖 / L1,L2로 손목 도달 불가 / 링크 길이 퇴화
+_IK_STATUS = ('ok', 'too_far', 'wrist_unreachable', 'singular_links')
+
+# --- Numba kernels (optional) ---
+if NUMBA_AVAILABLE:
+    # 첫 호출 때 컴파일 (시그니처를 지정하면 import 시점에 컴파일되어 GUI 시작이 느려짐)
+    # cache=True는 쓰지 않음: 디스크 캐시가 처음 컴파일한 모듈 이름에 묶여
+    # 스크립트(__main__)로 실행한 뒤 import하면 실패함
+    @njit(fastmath=True)
+    def _fk_kernel(L1, L2, L3, q1, q2, q3):
+        pts = np.zeros((4, 2))
+        a1 = q1
+        a2 = a1 + q2
+        a3 = a2 + q3
+        pts[1, 0] = L1 * math.cos(a1)
+        pts[1, 1] = L1 * math.sin(a1)
+        pts[2, 0] = pts[1, 0] + L2 * math.cos(a2)
+        pts[2, 1] = pts[1, 1] + L2 * math.sin(a2)
+        pts[3, 0] = pts[2, 0] + L3 * math.cos(a3)
+        pts[3, 1] = pts[2, 1] + L3 * math.sin(a3)
+        return pts
 
 # --- Kinematics Class ---
 class RobotKinematics:
     def __init__(self, L1_init, L2_init, L3_init):
-        self.L1 = L1_init
-        self.L2 = L2_init
-        self.L3 = L3_init
+        self.set_link_lengths(L1_init, L2_init, L3_init)
         self.q1_rad, self.q2_rad, self.q3_rad = 0.0, 0.0, 0.0 # Current angles in radians
+        self._fk_key = None # 마지막 GUI FK 입력 (L1,L2,L3,q1,q2,q3)
+        self._fk_cache = None
 
     def set_link_lengths(self, L1, L2, L3):
         self.L1 = L1
         self.L2 = L2
         self.L3 = L3
+        # IK에서 쓰는 길이 조합은 링크 길이가 바뀔 때만 다시 계산
+        self._L1sq = L1 * L1
+        self._L2sq = L2 * L2
+        self._twoL1L2 = 2 * L1 * L2
+        r_min = abs(L1 - L2) - 1e-6
+        self._Lreach_sq = (L1 + L2 + L3 + 1e-6)**2 # 말단 도달 가능 거리^2 (허용 오차 포함)
+        self._Lsum_sq = (L1 + L2 + 1e-6)**2 # 손목 도달 가능 거리^2
+        self._Ldiff_sq = r_min * r_min if r_min > 0.0 else -1.0
 
     def set_joint_angles_rad(self, q1_rad, q2_rad, q3_rad):
         self.q1_rad = normalize_angle(q1_rad)
@@ -34,89 +74,119 @@ class RobotKinematics:
         self.q3_rad = normalize_angle(q3_rad)
 
     def forward_kinematics(self):
-        P0 = np.array([0.0, 0.0])
-        abs_q1 = self.q1_rad
-        P1_x = self.L1 * np.cos(abs_q1)
-        P1_y = self.L1 * np.sin(abs_q1)
-        P1 = np.array([P1_x, P1_y])
-
-        abs_q2 = self.q1_rad + self.q2_rad
-        P2_x = P1[0] + self.L2 * np.cos(abs_q2)
-        P2_y = P1[1] + self.L2 * np.sin(abs_q2)
-        P2 = np.array([P2_x, P2_y])
-
-        abs_q3 = self.q1_rad + self.q2_rad + self.q3_rad
-        P3_x = P2[0] + self.L3 * np.cos(abs_q3)
-        P3_y = P2[1] + self.L3 * np.sin(abs_q3)
-        P3 = np.array([P3_x, P3_y])
-        return P0, P1, P2, P3
+        # 반환: (4, 2) [P0, P1, P2, P3] (행 단위로 P0, P1, P2, P3 = ... 언패킹 가능)
+        if NUMBA_AVAILABLE:
+            return _fk_kernel(self.L1, self.L2, self.L3, self.q1_rad, self.q2_rad, self.q3_rad)
+
+        # 누적 관절각으로 세 링크의 변위를 한 번에 계산한 뒤 cumsum으로 P1..P3를 구함
+        L = np.array([self.L1, self.L2, self.L3])
+        abs_q = np.cumsum([self.q1_rad, self.q2_rad, self.q3_rad])
+        pts = np.zeros((4, 2))
+        np.cumsum(L * np.cos(abs_q), out=pts[1:, 0])
+        np.cumsum(L * np.sin(abs_q), out=pts[1:, 1])
+        return pts
+
+    def forward_kinematics_cached(self):
+        # GUI 갱신용 FK: L, q가 그대로면 직전 결과(같은 객체)를 반환
+        key = (self.L1, self.L2, self.L3, self.q1_rad, self.q2_rad, self.q3_rad)
+        if key == self._fk_key: return self._fk_cache
+        self._fk_key = key
+        self._fk_cache = self.forward_kinematics()
+        return self._fk_cache
 
     def inverse_kinematics(self, target_x, target_y, phi_e_rad=0):
-        xw = target_x - self.L3 * np.cos(phi_e_rad)
-        yw = target_y - self.L3 * np.sin(phi_e_rad)
+        # 반환: (elbow-up 해, elbow-down 해, 상태) - 해가 없으면 None, None과 _IK_STATUS의 사유
+        # 도달 가능 범위 판정은 제곱 거리로 (sqrt 생략)
+        if target_x**2 + target_y**2 > self._Lreach_sq: return None, None, 'too_far'
+        xw = target_x - self.L3 * math.cos(phi_e_rad)
+        yw = target_y - self.L3 * math.sin(phi_e_rad)
         D_sq = xw**2 + yw**2
 
-        if self.L1 <= 1e-6 or self.L2 <= 1e-6: return None, None
-        dist_xw_yw = np.sqrt(D_sq)
-
-        if dist_xw_yw > self.L1 + self.L2 + 1e-6 or \
-           dist_xw_yw < np.abs(self.L1 - self.L2) - 1e-6:
-            return None, None
+        if self.L1 <= 1e-6 or self.L2 <= 1e-6: return None, None, 'singular_links'
+        if D_sq > self._Lsum_sq or D_sq < self._Ldiff_sq:
+            return None, None, 'wrist_unreachable'
 
+        # elbow-up / elbow-down 두 해는 q2 부호만 다르므로 길이 2 배열로 한 번에 계산
         if D_sq < 1e-9:
-            if np.abs(self.L1 - self.L2) < 1e-9:
-                q1_up_calc, q2_raw_up_calc = 0, np.pi
-                q1_down_calc, q2_raw_down_calc = 0, np.pi
-            else:
-                return None, None
+            if abs(self.L1 - self.L2) >= 1e-9: return None, None, 'wrist_unreachable'
+            q1 = np.zeros(2)
+            q2 = np.array([math.pi, math.pi])
         else:
-            cos_q2_raw_num = D_sq - self.L1**2 - self.L2**2
-            cos_q2_raw_den = 2 * self.L1 * self.L2
-            if np.abs(cos_q2_raw_den) < 1e-9: return None, None
+            if abs(self._twoL1L2) < 1e-9: return None, None, 'singular_links'
             
-            cos_q2_raw = np.clip(cos_q2_raw_num / cos_q2_raw_den, -1.0, 1.0)
-            q2_raw_up_calc = -np.arccos(cos_q2_raw)
-            q2_raw_down_calc = np.arccos(cos_q2_raw)
-
-            k1_up = self.L1 + self.L2 * np.cos(q2_raw_up_calc)
-            k2_up = self.L2 * np.sin(q2_raw_up_calc)
-            q1_up_calc = np.arctan2(yw, xw) - np.arctan2(k2_up, k1_up)
-
-            k1_down = self.L1 + self.L2 * np.cos(q2_raw_down_calc)
-            k2_down = self.L2 * np.sin(q2_raw_down_calc)
-            q1_down_calc = np.arctan2(yw, xw) - np.arctan2(k2_down, k1_down)
-
-        q3_up_calc = phi_e_rad - (q1_up_calc + q2_raw_up_calc)
-        q3_down_calc = phi_e_rad - (q1_down_calc + q2_raw_down_calc)
-
-        sol1 = (normalize_angle(q1_up_calc), normalize_angle(q2_raw_up_calc), normalize_angle(q3_up_calc))
-        sol2 = (normalize_angle(q1_down_calc), normalize_angle(q2_raw_down_calc), normalize_angle(q3_down_calc))
-        return sol1, sol2
+            cos_q2_raw = min(max((D_sq - self._L1sq - self._L2sq) / self._twoL1L2, -1.0), 1.0)
+            q2_abs = math.acos(cos_q2_raw)
+            q2 = np.array([-q2_abs, q2_abs])
+            q1 = math.atan2(yw, xw) - np.arctan2(self.L2 * np.sin(q2), self.L1 + self.L2 * np.cos(q2))
+
+        q3 = _norm_vec(phi_e_rad - (q1 + q2))
+        q1 = _norm_vec(q1)
+        q2 = _norm_vec(q2)
+
+        sol1 = (q1[0], q2[0], q3[0])
+        sol2 = (q1[1], q2[1], q3[1])
+        return sol1, sol2, 'ok'
+
+    def inverse_kinematics_batch(self, target_x, target_y, phi_e_rad=0):
+        # 여러 목표를 배열 연산으로 한 번에 계산 (판정 기준은 inverse_kinematics와 동일)
+        # 반환: (elbow-up (N,3), elbow-down (N,3), 해 존재 여부 (N,)), 해가 없는 행은 NaN
+        tx, ty, phi = np.broadcast_arrays(np.atleast_1d(np.asarray(target_x, dtype=float)),
+                                          np.asarray(target_y, dtype=float), np.asarray(phi_e_rad, dtype=float))
+        sol_up = np.full(tx.shape + (3,), np.nan)
+        sol_down = np.full(tx.shape + (3,), np.nan)
+        if self.L1 <= 1e-6 or self.L2 <= 1e-6:
+            return sol_up, sol_down, np.zeros(tx.shape, dtype=bool)
+
+        xw = tx - self.L3 * np.cos(phi)
+        yw = ty - self.L3 * np.sin(phi)
+        D_sq = xw**2 + yw**2
+        at_base = D_sq < 1e-9 # 손목이 원점 (L1 == L2일 때만 해 존재)
+        valid = (tx**2 + ty**2 <= self._Lreach_sq) & (D_sq <= self._Lsum_sq) & (D_sq >= self._Ldiff_sq)
+        if abs(self._twoL1L2) < 1e-9: valid &= at_base
+        if abs(self.L1 - self.L2) >= 1e-9: valid &= ~at_base
+
+        # 행 0: elbow-up, 행 1: elbow-down
+        q2_abs = np.arccos(np.clip((D_sq - self._L1sq - self._L2sq) / self._twoL1L2, -1.0, 1.0))
+        q2 = np.stack([-q2_abs, q2_abs])
+        q2[:, at_base] = math.pi
+        q1 = np.arctan2(yw, xw) - np.arctan2(self.L2 * np.sin(q2), self.L1 + self.L2 * np.cos(q2))
+        q1[:, at_base] = 0.0
+        q3 = _norm_vec(phi - (q1 + q2))
+        q1 = _norm_vec(q1)
+        q2 = _norm_vec(q2)
+
+        sol_up[valid] = np.stack([q1[0], q2[0], q3[0]], axis=-1)[valid]
+        sol_down[valid] = np.stack([q1[1], q2[1], q3[1]], axis=-1)[valid]
+        return sol_up, sol_down, valid
+
+    @staticmethod
+    def _near_axis(q_rad):
+        # 정규화된 각도는 [-pi, pi) 이므로 0 또는 ±pi 까지의 거리는 min(|q|, pi-|q|)
+        q_abs = abs(q_rad)
+        return min(q_abs, math.pi - q_abs) < _SINGULARITY_THRESHOLD_RAD
 
     def is_solution_near_singularity(self, sol_rad):
         if sol_rad is None: return False
-        _, q2_r, q3_r = sol_rad
-        thresh_rad = np.deg2rad(SINGULARITY_THRESHOLD_DEG)
-        if abs(q2_r) < thresh_rad or abs(abs(q2_r) - np.pi) < thresh_rad: return True
-        if abs(q3_r) < thresh_rad or abs(abs(q3_r) - np.pi) < thresh_rad: return True
-        return False
+        return self._near_axis(sol_rad[1]) or self._near_axis(sol_rad[2])
     
     def check_current_angles_singularity(self):
         is_singular = False
         messages = []
-        thresh_rad = np.deg2rad(SINGULARITY_THRESHOLD_DEG)
-        if abs(self.q2_rad) < thresh_rad or abs(abs(self.q2_rad) - np.pi) < thresh_rad:
+        if self._near_axis(self.q2_rad):
             is_singular = True
             messages.append("팔꿈치 특이점")
-        if abs(self.q3_rad) < thresh_rad or abs(abs(self.q3_rad) - np.pi) < thresh_rad:
+        if self._near_axis(self.q3_rad):
             is_singular = True
             messages.append("손목 특이점")
         return is_singular, messages
 
 
 def normalize_angle(angle_rad):
-    angle_rad = (angle_rad + np.pi) % (2 * np.pi) - np.pi
-    return angle_rad
+    return (angle_rad + math.pi) % (2 * math.pi) - math.pi
+
+def _norm_vec(angles_rad):
+    # normalize_angle의 배열 버전
+    return (angles_rad + math.pi) % (2 * math.pi) - math.pi
 
 # --- GUI Application Class ---
 class RobotArmGUI:
@@ -133,9 +203,13 @@ class RobotArmGUI:
         self.robot.set_joint_angles_rad(*[np.deg2rad(q) for q in self.initial_q_values_deg])
 
         self._last_valid_L_values = list(self.initial_L_values)
+        self._L_total = sum(self._last_valid_L_values) # 링크 길이 합 (허용된 값 기준)
         self.ik_solution_up = None
         self.ik_solution_down = None
         self._after_id = None
+        self._last_fk = None # 마지막으로 그린 FK 결과 (같은 객체면 다시 그리지 않음)
+        self._redraw_pending = False # parameter_changed_callback 갱신 대기 여부
+        self._last_frame_t = 0.0 # 마지막 갱신이 끝난 시각 (time.perf_counter)
 
         master.protocol("WM_DELETE_WINDOW", self.on_closing)
         self._setup_ui()
@@ -161,6 +235,9 @@ class RobotArmGUI:
         params_group = ttk.LabelFrame(self.left_controls_frame, text="로봇 파라미터", padding="10")
         params_group.pack(fill=tk.X, pady=5, anchor=tk.N)
 
+        # 숫자 입력 검증 콜백은 한 번만 등록해 모든 입력칸에서 공유
+        self._vcmd = (self.master.register(self._validate_float), '%d', '%P')
+
         self.L_vars = []
         self.q_vars = []
         self.L_range_labels = []
@@ -233,6 +310,7 @@ class RobotArmGUI:
         self.joint2_dot, = self.ax.plot([], [], 'ko', markersize=7)
         self.joint3_dot, = self.ax.plot([], [], 'ko', markersize=7)
         self.ee_dot, = self.ax.plot([], [], 'ro', markersize=10, label='End-Effector')
+        self._ee_color = 'red'
         self.target_marker, = self.ax.plot([], [], 'gx', markersize=10, label='Target')
         self.ax.set_xlim(-WORKSPACE_LIMIT -1, WORKSPACE_LIMIT +1)
         self.ax.set_ylim(-WORKSPACE_LIMIT -1, WORKSPACE_LIMIT +1)
@@ -247,6 +325,31 @@ class RobotArmGUI:
                                        fill=False, edgecolor='gray', linestyle='--')
         self.ax.add_patch(workspace_rect)
 
+        # 움직이는 artist는 blit로만 그리고, 정적인 축/격자/범례는 배경으로 캡처해 재사용
+        # (base_dot은 링크 위에 겹쳐 그려지도록 생성 순서대로 함께 포함)
+        self._anim_artists = (self.line_l1, self.line_l2, self.line_l3, self.base_dot,
+                              self.joint1_dot, self.joint2_dot, self.joint3_dot,
+                              self.ee_dot, self.target_marker)
+        for art in self._anim_artists: art.set_animated(True)
+        self._bg = None
+        self.canvas.mpl_connect('draw_event', self._on_canvas_draw)
+        self.canvas.mpl_connect('resize_event', self._on_canvas_resize)
+
+    def _on_canvas_draw(self, event):
+        # 전체 그리기 후 배경 갱신 (animated artist는 전체 그리기에서 빠지므로 여기서 그림)
+        self._bg = self.canvas.copy_from_bbox(self.ax.bbox)
+        for art in self._anim_artists: self.ax.draw_artist(art)
+
+    def _on_canvas_resize(self, event):
+        self._bg = None
+
+    def redraw_plot(self):
+        if self._bg is None: # 배경이 없으면 전체 그리기 (draw_event에서 배경 캡처)
+            self.canvas.draw_idle(); return
+        self.canvas.restore_region(self._bg)
+        for art in self._anim_artists: self.ax.draw_artist(art)
+        self.canvas.blit(self.ax.bbox)
+
     def on_closing(self):
         if self._after_id: self.master.after_cancel(self._after_id)
         self.master.quit()
@@ -276,26 +379,26 @@ class RobotArmGUI:
             rounded_val = round(temp_l_values[i], DECIMAL_PLACES)
             self.L_vars[i].set(rounded_val)
             self._last_valid_L_values[i] = rounded_val
+        self._L_total = sum(self._last_valid_L_values)
         
         # Sync to robot object
         self.robot.set_link_lengths(*self._last_valid_L_values)
 
 
+    def _validate_float(self, action, val_if_allowed):
+        if action == '1': # Insert
+            if val_if_allowed in ["", "-", ".", "-."]: return True
+            try: float(val_if_allowed); return True
+            except ValueError: return False
+        return True
+
     def _create_param_entry(self, parent, label_text, var, step, command, is_length=False, index=None, show_range=True):
         frame = ttk.Frame(parent)
         frame.pack(fill=tk.X, pady=2)
         ttk.Label(frame, text=label_text, width=15).pack(side=tk.LEFT)
         entry = ttk.Entry(frame, textvariable=var, width=10)
         entry.pack(side=tk.LEFT, padx=5)
-
-        def validate_float(action, val_if_allowed, text_ins, val_type, widget_name):
-            if action == '1': # Insert
-                if val_if_allowed in ["", "-", ".", "-."]: return True
-                try: float(val_if_allowed); return True
-                except ValueError: return False
-            return True
-        vcmd = (parent.register(validate_float), '%d', '%P', '%S', '%v', '%W')
-        entry.config(validate='key', validatecommand=vcmd)
+        entry.config(validate='key', validatecommand=self._vcmd)
 
         if command:
             entry.bind("<Return>", lambda e, v=var, cmd=command, l=is_length, i=index: self.on_entry_change_gui(v, cmd, l, i))
@@ -321,7 +424,20 @@ class RobotArmGUI:
 
     def parameter_changed_callback(self):
         self.clear_ik_solutions_gui()
+        # 연속 입력 중에는 갱신 요청을 모아서 유휴 시점에 한 번만 그림
+        if not self._redraw_pending:
+            self._redraw_pending = True
+            self.master.after_idle(self._flush_redraw)
+
+    def _flush_redraw(self):
+        if not self._redraw_pending: return
+        wait = self._last_frame_t + MIN_REDRAW_INTERVAL - time.perf_counter()
+        if wait > 0: # 직전 프레임 직후면 남은 시간만큼 미룸 (대기 중에는 요청이 계속 합쳐짐)
+            self.master.after(int(wait * 1000) + 1, self._flush_redraw)
+            return
+        self._redraw_pending = False
         self.update_plot_and_fk_from_ui()
+        self._last_frame_t = time.perf_counter()
 
     def on_entry_change_gui(self, var, command_func, is_length_var=False, length_index=None):
         try:
@@ -333,10 +449,10 @@ class RobotArmGUI:
             
             float_val = float(current_str)
             if is_length_var and length_index is not None:
-                L_others_sum = sum(self.L_vars[j].get() for j in range(3) if j != length_index)
+                L_others_sum = self._L_total - self._last_valid_L_values[length_index]
                 max_this = max(MIN_LINK_LENGTH, MAX_REACH_SUM - L_others_sum)
                 clamped = max(MIN_LINK_LENGTH, min(float_val, max_this))
-                var.set(round(clamped, DECIMAL_PLACES))
+                self._accept_length(length_index, clamped)
             
             if command_func: command_func()
         except (tk.TclError, ValueError):
@@ -345,16 +461,23 @@ class RobotArmGUI:
             if command_func: command_func()
 
 
+    def _accept_length(self, index, value):
+        # 허용된 길이를 GUI 변수와 _last_valid_L_values, _L_total에 바로 반영
+        value = round(value, DECIMAL_PLACES)
+        self.L_vars[index].set(value)
+        self._last_valid_L_values[index] = value
+        self._L_total = sum(self._last_valid_L_values)
+
     def increment_value_gui(self, var, step, command_func, is_length_var=False, length_index=None):
         try: current_val = var.get()
         except tk.TclError: current_val = self._last_valid_L_values[length_index] if is_length_var and length_index is not None else 0.0
         
         new_val_attempt = round(current_val + step, DECIMAL_PLACES + 1)
         if is_length_var and length_index is not None:
-            L_others_sum = sum(self.L_vars[j].get() for j in range(3) if j != length_index)
+            L_others_sum = self._L_total - self._last_valid_L_values[length_index]
             max_this = max(MIN_LINK_LENGTH, MAX_REACH_SUM - L_others_sum)
             clamped = max(MIN_LINK_LENGTH, min(new_val_attempt, max_this))
-            var.set(round(clamped, DECIMAL_PLACES))
+            self._accept_length(length_index, clamped)
         else:
             var.set(round(new_val_attempt, 1))
         
@@ -378,26 +501,28 @@ class RobotArmGUI:
             except tk.TclError: # If GUI var is invalid, use internal cache
                 val = self._last_valid_L_values[i]
                 self.L_vars[i].set(val)
+        self._L_total = sum(self._last_valid_L_values)
         self.robot.set_link_lengths(*self._last_valid_L_values)
 
         # Sync joint angles from q_vars to robot object
-        q_rad_gui = [np.deg2rad(self.q_vars[i].get()) for i in range(3)]
+        q_rad_gui = [math.radians(self.q_vars[i].get()) for i in range(3)]
         self.robot.set_joint_angles_rad(*q_rad_gui)
 
 
     def update_length_ranges_display(self):
         self._sync_robot_params_from_gui() # Ensure robot L values are current
-        current_L_values = [self.robot.L1, self.robot.L2, self.robot.L3]
+        self._update_length_ranges_display(self._last_valid_L_values)
 
+    def _update_length_ranges_display(self, current_L_values):
+        # current_L_values: 이미 동기화된 링크 길이 (GUI 값을 반올림한 것과 같음)
         for i in range(3):
-            other_L_sum = sum(current_L_values[j] for j in range(3) if j != i)
+            other_L_sum = self._L_total - current_L_values[i]
             max_li = round(max(MIN_LINK_LENGTH, MAX_REACH_SUM - other_L_sum), DECIMAL_PLACES)
             min_li = round(MIN_LINK_LENGTH, DECIMAL_PLACES)
             
             if self.L_range_labels[i]:
                 self.L_range_labels[i].config(text=f"[{min_li:.{DECIMAL_PLACES}f} ~ {max_li:.{DECIMAL_PLACES}f}]")
-                current_li_val_gui = round(self.L_vars[i].get(), DECIMAL_PLACES) # Value in GUI
-                if not (min_li - 1e-6 <= current_li_val_gui <= max_li + 1e-6):
+                if not (min_li - 1e-6 <= current_L_values[i] <= max_li + 1e-6):
                     self.L_range_labels[i].config(foreground="red")
                     # self.L_entries[i].config(foreground="red") # Entry text color change can be distracting
                 else:
@@ -405,8 +530,8 @@ class RobotArmGUI:
                     # self.L_entries[i].config(foreground="black")
 
     def update_plot_and_fk_from_ui(self):
-        self._sync_robot_params_from_gui() # Sync L and q from GUI to robot object
-        self.update_length_ranges_display() # Update ranges based on synced L
+        self._sync_robot_params_from_gui() # Sync L and q from GUI to robot object (once per event)
+        self._update_length_ranges_display(self._last_valid_L_values) # Update ranges based on synced L
         self.update_plot_and_fk()           # Perform FK and plot with robot object's state
 
     def update_robot_status_display(self):
@@ -420,18 +545,26 @@ class RobotArmGUI:
 
     def update_plot_and_fk(self):
         # Assumes robot object (self.robot) has the correct L and q values
-        P0, P1, P2, P3 = self.robot.forward_kinematics()
-        self.line_l1.set_data([P0[0], P1[0]], [P0[1], P1[1]])
-        self.line_l2.set_data([P1[0], P2[0]], [P1[1], P2[1]])
-        self.line_l3.set_data([P2[0], P3[0]], [P2[1], P3[1]])
-        self.joint1_dot.set_data([P0[0]],[P0[1]]); self.joint2_dot.set_data([P1[0]],[P1[1]])
-        self.joint3_dot.set_data([P2[0]],[P2[1]]); self.ee_dot.set_data([P3[0]],[P3[1]])
+        xy = self.robot.forward_kinematics_cached() # (4, 2) [P0, P1, P2, P3]
+        if xy is self._last_fk: return # L, q 변화 없음
+        self._last_fk = xy
+        # 리스트를 만들지 않고 FK 결과의 열(view)을 그대로 넘김
+        x, y = xy[:, 0], xy[:, 1]
+        self.line_l1.set_data(x[0:2], y[0:2])
+        self.line_l2.set_data(x[1:3], y[1:3])
+        self.line_l3.set_data(x[2:4], y[2:4])
+        self.joint1_dot.set_data(x[0:1], y[0:1]); self.joint2_dot.set_data(x[1:2], y[1:2])
+        self.joint3_dot.set_data(x[2:3], y[2:3]); self.ee_dot.set_data(x[3:4], y[3:4])
+        P3 = xy[3]
         self.current_ee_x_var.set(f"X: {P3[0]:.3f}")
         self.current_ee_y_var.set(f"Y: {P3[1]:.3f}")
-        self.ee_dot.set_markerfacecolor('magenta' if abs(P3[0]) > WORKSPACE_LIMIT or abs(P3[1]) > WORKSPACE_LIMIT else 'red')
+        ee_color = 'magenta' if abs(P3[0]) > WORKSPACE_LIMIT or abs(P3[1]) > WORKSPACE_LIMIT else 'red'
+        if ee_color != self._ee_color: # 작업 공간 경계를 넘을 때만 색 변경
+            self.ee_dot.set_markerfacecolor(ee_color)
+            self._ee_color = ee_color
         
         self.update_robot_status_display() # Update singularity status based on current robot angles
-        self.canvas.draw_idle()
+        self.redraw_plot()
 
     def clear_ik_solutions_gui(self):
         self.ik_solution_up = None
@@ -445,26 +578,19 @@ class RobotArmGUI:
         
         target_x = self.target_x_var.get()
         target_y = self.target_y_var.get()
-        phi_e_rad = np.deg2rad(self.phi_e_var.get())
+        phi_e_rad = math.radians(self.phi_e_var.get())
 
         self.target_marker.set_data([target_x], [target_y])
         self.clear_ik_solutions_gui()
 
         # Use robot object's current link lengths for IK calculation
-        current_L_sum = self.robot.L1 + self.robot.L2 + self.robot.L3
-        if np.sqrt(target_x**2 + target_y**2) > current_L_sum + 1e-6:
+        temp_sol_up, temp_sol_down, ik_status = self.robot.inverse_kinematics(target_x, target_y, phi_e_rad)
+        if ik_status == 'too_far':
             self.ik_status_var.set("이동 불가 (목표가 너무 멉니다)")
-            self.canvas.draw_idle(); return
-        
-        # Further reachability for L1,L2 to wrist
-        xw = target_x - self.robot.L3 * np.cos(phi_e_rad)
-        yw = target_y - self.robot.L3 * np.sin(phi_e_rad)
-        if np.sqrt(xw**2+yw**2) < np.abs(self.robot.L1-self.robot.L2)-1e-6 or \
-           np.sqrt(xw**2+yw**2) > self.robot.L1+self.robot.L2+1e-6 :
+            self.redraw_plot(); return
+        if ik_status == 'wrist_unreachable':
             self.ik_status_var.set("이동 불가 (L1,L2로 손목 도달 불가)")
-            self.canvas.draw_idle(); return
-
-        temp_sol_up, temp_sol_down = self.robot.inverse_kinematics(target_x, target_y, phi_e_rad)
+            self.redraw_plot(); return
         
         up_singular = self.robot.is_solution_near_singularity(temp_sol_up)
         down_singular = self.robot.is_solution_near_singularity(temp_sol_down)
@@ -493,7 +619,7 @@ class RobotArmGUI:
             elif self.ik_solution_down: self.apply_ik_solution_gui(self.ik_solution_down)
         else:
             self.ik_status_var.set("이동 불가 (유효 해법 없음 또는 특이점)")
-        self.canvas.draw_idle()
+        self.redraw_plot()
 
     def apply_ik_solution_gui(self, solution_rad):
         if solution_rad:
@@ -542,6 +668,7 @@ class RobotArmGUI:
         self.clear_ik_solutions_gui()
         self.ik_status_var.set("")
         self.update_plot_and_fk_from_ui()
+        self.redraw_plot() # target_marker 제거 반영 (자세가 같으면 위에서 다시 그리지 않음)
 
 
 if __name__ == '__main__':